@@ -4,10 +4,16 @@ Adapted from confluence-markdown-exporter by Sebastian Penhouet.
 https://github.com/Spenhouet/confluence-markdown-exporter
 """
 
+import base64
+import hashlib
 import logging
 from typing import Any
 
+import requests
 from atlassian import Confluence as ConfluenceApiSdk
+from requests.adapters import DEFAULT_POOLSIZE, DEFAULT_RETRIES, HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.util import Retry
 
 from roundtripper.config import ApiDetails
 from roundtripper.config_store import get_settings
@@ -15,6 +21,38 @@ from roundtripper.config_store import get_settings
 #: Logger instance.
 LOGGER = logging.getLogger(__name__)
 
+#: Connection settings applied to the HTTP session instead of being passed to the SDK.
+_SESSION_SETTINGS = frozenset({"pool_maxsize"})
+
+#: Clients by connection settings, shared by all callers in this process, each with whether its
+#: connection has been tested.
+_CLIENT_CACHE: dict[tuple[str, ...], tuple[ConfluenceApiSdk, bool]] = {}
+
+
+class PrecomputedBasicAuth(AuthBase):
+    """HTTP Basic authentication with the ``Authorization`` header encoded only once.
+
+    ``requests`` re-encodes username and password for every request when given a tuple.
+    """
+
+    def __init__(self, username: str, password: str) -> None:
+        """Initialize with the credentials to encode.
+
+        Parameters
+        ----------
+        username
+            The user name (email).
+        password
+            The password or API token.
+        """
+        credentials = base64.b64encode(f"{username}:{password}".encode("latin1"))
+        self.header = f"Basic {credentials.decode('ascii')}"
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        """Attach the precomputed header to the request."""
+        r.headers["Authorization"] = self.header
+        return r
+
 
 class ConfluenceClientFactory:
     """Factory for creating authenticated Confluence API clients with retry config."""
@@ -29,13 +67,15 @@ class ConfluenceClientFactory:
         """
         self.connection_config = connection_config
 
-    def create(self, auth: ApiDetails) -> ConfluenceApiSdk:
+    def create(self, auth: ApiDetails, *, test_connection: bool = True) -> ConfluenceApiSdk:
         """Create an authenticated Confluence client.
 
         Parameters
         ----------
         auth
             API details including URL and credentials.
+        test_connection
+            If True, fetch the space list once to verify URL and credentials.
 
         Returns
         -------
@@ -48,35 +88,123 @@ class ConfluenceClientFactory:
             If the connection to Confluence fails.
         """
         try:
-            LOGGER.debug("Creating Confluence API client for URL: %s", str(auth.url))
+            LOGGER.debug("Creating Confluence API client for URL: %s", auth.url)
+
+            # Read each secret once; empty secrets mean "not configured"
+            pat = auth.pat.get_secret_value() or None
+            api_token = auth.api_token.get_secret_value() or None
+            username = auth.username.get_secret_value() if api_token else None
 
             # Determine authentication method for logging
-            if auth.pat:
+            if pat:
                 LOGGER.debug("Using Personal Access Token (PAT) authentication")
-            elif auth.api_token:
+            elif api_token:
                 LOGGER.debug("Using Basic authentication (username + API token)")
 
+            sdk_config = {
+                key: value
+                for key, value in self.connection_config.items()
+                if key not in _SESSION_SETTINGS
+            }
             instance = ConfluenceApiSdk(
-                url=str(auth.url),
-                username=auth.username.get_secret_value() if auth.api_token else None,
-                password=auth.api_token.get_secret_value() if auth.api_token else None,
-                token=auth.pat.get_secret_value() if auth.pat else None,
-                **self.connection_config,
+                url=auth.url_str,
+                username=username,
+                password=api_token,
+                token=pat,
+                **sdk_config,
             )
-            # Test connection
-            LOGGER.debug("Testing connection by fetching space list...")
-            instance.get_all_spaces(limit=1)
-            LOGGER.debug("Connection test successful")
+            if username and api_token:
+                instance._session.auth = PrecomputedBasicAuth(username, api_token)
+            self._mount_pooled_adapter(instance._session, instance.url)
         except Exception as e:
             LOGGER.error("Confluence connection failed: %s", e)
             msg = f"Confluence connection failed: {e}"
             raise ConnectionError(msg) from e
+        if test_connection:
+            _test_connection(instance)
         return instance
 
+    def _mount_pooled_adapter(self, session: requests.Session, url: str) -> None:
+        """Mount an HTTP adapter with a connection pool sized for concurrent requests.
+
+        The retry policy of the adapter currently serving ``url`` (set up by the SDK
+        when backoff and retry is enabled) is kept. If it retries throttled responses,
+        failed connection attempts are retried as often, with the same jittered backoff.
+
+        Parameters
+        ----------
+        session
+            The HTTP session of the SDK client.
+        url
+            Base URL of the Confluence instance.
+        """
+        pool_maxsize = self.connection_config.get("pool_maxsize", DEFAULT_POOLSIZE)
+        current = session.get_adapter(url)
+        retries = (
+            current.max_retries
+            if isinstance(current, HTTPAdapter)
+            else Retry(DEFAULT_RETRIES, read=False)
+        )
+        if retries.status:
+            retries = retries.new(connect=retries.status)
+        LOGGER.debug("Using connection pool with up to %d connections", pool_maxsize)
+        session.mount(url, HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retries))
+
+
+def _test_connection(client: ConfluenceApiSdk) -> None:
+    """Fetch the space list once to verify URL and credentials.
+
+    Parameters
+    ----------
+    client
+        Confluence client to test.
+
+    Raises
+    ------
+    ConnectionError
+        If the connection to Confluence fails.
+    """
+    LOGGER.debug("Testing connection by fetching space list...")
+    try:
+        client.get_all_spaces(limit=1)
+    except Exception as e:
+        LOGGER.error("Confluence connection failed: %s", e)
+        msg = f"Confluence connection failed: {e}"
+        raise ConnectionError(msg) from e
+    LOGGER.debug("Connection test successful")
+
+
+def _client_cache_key(auth: ApiDetails, connection_config: dict[str, Any]) -> tuple[str, ...]:
+    """Build the cache key identifying a client for the given settings.
 
-def get_confluence_client() -> ConfluenceApiSdk:
+    Credentials are only included as hashes, so the cache does not keep them in plain text.
+    """
+    secrets = (auth.username, auth.api_token, auth.pat)
+    return (
+        auth.url_str,
+        *(hashlib.sha256(s.get_secret_value().encode()).hexdigest() for s in secrets),
+        repr(sorted(connection_config.items())),
+    )
+
+
+def clear_client_cache() -> None:
+    """Forget all cached Confluence clients so the next call reconnects."""
+    _CLIENT_CACHE.clear()
+
+
+def get_confluence_client(*, test_connection: bool = True) -> ConfluenceApiSdk:
     """Get an authenticated Confluence API client using current settings.
 
+    Clients are cached per URL, credentials, and connection settings, so repeated
+    calls within one process reuse the connection. Each cached client is tested at most
+    once, on the first call that asks for a tested client.
+
+    Parameters
+    ----------
+    test_connection
+        If True, a client that has not been tested yet verifies URL and credentials with
+        one request.
+
     Returns
     -------
     ConfluenceApiSdk
@@ -92,5 +220,19 @@ def get_confluence_client() -> ConfluenceApiSdk:
     auth = settings.auth.confluence
     connection_config = settings.connection_config.model_dump()
 
+    key = _client_cache_key(auth, connection_config)
+    cached = _CLIENT_CACHE.get(key)
+    if cached is not None:
+        LOGGER.debug("Reusing cached Confluence API client")
+        client, tested = cached
+        if test_connection and not tested:
+            _test_connection(client)
+            _CLIENT_CACHE[key] = (client, True)
+        return client
+
     LOGGER.debug("Initializing Confluence API client")
-    return ConfluenceClientFactory(connection_config).create(auth)
+    client = ConfluenceClientFactory(connection_config).create(
+        auth, test_connection=test_connection
+    )
+    _CLIENT_CACHE[key] = (client, test_connection)
+    return client
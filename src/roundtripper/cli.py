@@ -9,7 +9,6 @@ from rich.console import Console
 from rich.logging import RichHandler
 
 from roundtripper import __version__
-from roundtripper.confluence import app as app_confluence
 from roundtripper.file_utils import is_xmllint_available
 
 #: Logger instance.
@@ -73,8 +72,9 @@ def main(
     return command(*bound.args, **bound.kwargs, **ignored_kwargs)
 
 
-# Register sub-apps
-app.command(app_confluence)
+# Register sub-apps lazily so that the Confluence stack is only imported when used; the help
+# text is given here as the top-level help page must not import the sub-app
+app.command("roundtripper.confluence:app", name="confluence", help="Confluence-related commands")
 
 
 def cli() -> None:
@@ -42,6 +42,11 @@ class ConnectionConfig(BaseModel):
         title="Retry Status Codes",
         description="HTTP status codes that should trigger a retry.",
     )
+    pool_maxsize: int = Field(
+        default=32,
+        title="Connection Pool Size",
+        description="Maximum number of connections to the Confluence server kept open for reuse.",
+    )
     verify_ssl: bool = Field(
         default=True,
         title="Verify SSL",
@@ -85,6 +90,11 @@ class ApiDetails(BaseModel):
         ),
     )
 
+    @property
+    def url_str(self) -> str:
+        """The instance URL as a string."""
+        return str(self.url)
+
     @field_serializer("username", "api_token", "pat", when_used="json")
     def dump_secret(self, v: SecretStr) -> str:
         """Serialize SecretStr fields as plain strings for JSON output."""
@@ -5,14 +5,16 @@ Adapted from confluence-markdown-exporter by Sebastian Penhouet.
 https://github.com/Spenhouet/confluence-markdown-exporter
 """
 
-import json
+import copy
 import os
+import stat
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from roundtripper.config import AuthConfig, ConfigModel, ConnectionConfig
+from roundtripper.config import ConfigModel
 
 
 def get_app_config_path() -> Path:
@@ -46,6 +48,35 @@ def get_app_config_path() -> Path:
 
 APP_CONFIG_PATH = get_app_config_path()
 
+#: The default configuration as returned by ``ConfigModel().model_dump()``; never mutated.
+_DEFAULTS_DICT: dict[str, Any] = ConfigModel().model_dump()
+
+#: Settings per config file path, with the file stamp (see ``_config_file_stamp``) they match.
+_SETTINGS_CACHE: dict[Path, tuple[tuple[int, int] | None, ConfigModel]] = {}
+
+
+def _config_file_stamp() -> tuple[int, int] | None:
+    """Return ``(st_mtime_ns, st_size)`` of the config file, or ``None`` if it does not exist."""
+    try:
+        stat = APP_CONFIG_PATH.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_settings() -> ConfigModel:
+    """Read and validate the config file, falling back to defaults if it is missing or invalid.
+
+    Returns
+    -------
+    ConfigModel
+        Configuration settings from the config file.
+    """
+    try:
+        return ConfigModel.model_validate_json(APP_CONFIG_PATH.read_bytes())
+    except (FileNotFoundError, ValidationError):
+        return ConfigModel()
+
 
 def load_app_data() -> dict[str, dict]:
     """Load application data from the config file.
@@ -58,20 +89,50 @@ def load_app_data() -> dict[str, dict]:
     dict[str, dict]
         Configuration data as a dictionary.
     """
-    if not APP_CONFIG_PATH.exists():
-        return ConfigModel().model_dump()
+    return get_settings().model_dump()
+
 
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` so that readers see either the old or the new file.
+
+    The data is written and synced to a temporary file next to ``path``, which then
+    replaces ``path``. An existing file keeps its mode; a new file is only readable by
+    the owner as it holds credentials.
+
+    Parameters
+    ----------
+    path
+        Path to the file to create/overwrite.
+    data
+        Content to write.
+    """
     try:
-        data = json.loads(APP_CONFIG_PATH.read_text())
-        return ConfigModel(**data).model_dump()
-    except (json.JSONDecodeError, ValidationError):
-        return ConfigModel().model_dump()
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o600
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        try:
+            os.fchmod(fd, mode)
+            # os.write may write less than asked for
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def save_app_data(config_model: ConfigModel) -> None:
     """Save application data to the config file.
 
     Uses Pydantic's model_dump_json which properly handles SecretStr serialization.
+    The file is replaced atomically, see ``_atomic_write_bytes``.
 
     Parameters
     ----------
@@ -79,48 +140,75 @@ def save_app_data(config_model: ConfigModel) -> None:
         The configuration model to save.
     """
     json_str = config_model.model_dump_json(indent=2)
-    APP_CONFIG_PATH.write_text(json_str)
+    _atomic_write_bytes(APP_CONFIG_PATH, json_str.encode())
+    # Cache a copy so that later changes to the caller's model are not picked up
+    _SETTINGS_CACHE[APP_CONFIG_PATH] = (_config_file_stamp(), config_model.model_copy(deep=True))
 
 
 def get_settings() -> ConfigModel:
     """Get the current application settings as a ConfigModel instance.
 
+    The config file is only read again when its modification time or size changes.
+    Each call returns a copy of the cached settings, so changing it has no effect on
+    the settings of later calls.
+
     Returns
     -------
     ConfigModel
         Current configuration settings.
     """
-    data = load_app_data()
-    return ConfigModel(
-        connection_config=ConnectionConfig(**data.get("connection_config", {})),
-        auth=AuthConfig(**data.get("auth", {})),
-    )
+    stamp = _config_file_stamp()
+    cached = _SETTINGS_CACHE.get(APP_CONFIG_PATH)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, _read_settings())
+        _SETTINGS_CACHE[APP_CONFIG_PATH] = cached
+    return cached[1].model_copy(deep=True)
 
 
-def _set_by_path(obj: dict, path: str, value: Any) -> None:
-    """Set a value in a nested dictionary by dot-notation path.
+def invalidate_settings() -> None:
+    """Forget the cached settings so the next ``get_settings`` call reads the config file."""
+    _SETTINGS_CACHE.clear()
+
+
+@lru_cache
+def _field_adapter(path: str) -> TypeAdapter[Any]:
+    """Return a validator for the ``ConfigModel`` field at a dot-notation path.
 
     Parameters
     ----------
-    obj
-        The dictionary to modify.
     path
         Dot-notation path (e.g., 'auth.confluence.url').
-    value
-        The value to set.
+
+    Returns
+    -------
+    TypeAdapter[Any]
+        Validator for the field's annotation and constraints.
+
+    Raises
+    ------
+    KeyError
+        If the path does not name a field.
     """
-    keys = path.split(".")
-    current = obj
-    for k in keys[:-1]:
-        if k not in current or not isinstance(current[k], dict):  # pragma: no cover
-            current[k] = {}
-        current = current[k]
-    current[keys[-1]] = value
+    current: Any = ConfigModel
+    annotation: Any = None
+    for k in path.split("."):
+        if not (isinstance(current, type) and issubclass(current, BaseModel)) or (
+            k not in current.model_fields
+        ):
+            msg = f"Invalid config path: {path}"
+            raise KeyError(msg)
+        field = current.model_fields[k]
+        current = field.annotation
+        annotation = field.rebuild_annotation()
+    return TypeAdapter(annotation)
 
 
 def set_setting(path: str, value: Any) -> None:
     """Set a setting by dot-path and save to config file.
 
+    The value is first validated against the field's type, then the resulting settings
+    are validated as a whole so that validators spanning several fields also apply.
+
     Parameters
     ----------
     path
@@ -130,12 +218,19 @@ def set_setting(path: str, value: Any) -> None:
 
     Raises
     ------
+    KeyError
+        If the path is invalid.
     ValueError
         If the value is invalid according to the Pydantic model.
     """
-    data = load_app_data()
-    _set_by_path(data, path, value)
+    adapter = _field_adapter(path)
+    data = get_settings().model_dump()
+    *parents, leaf = path.split(".")
+    section = data
+    for key in parents:
+        section = section[key]
     try:
+        section[leaf] = adapter.validate_python(value)
         settings = ConfigModel.model_validate(data)
     except ValidationError as e:
         raise ValueError(str(e)) from e
@@ -160,23 +255,14 @@ def get_default_value_by_path(path: str | None = None) -> Any:
     KeyError
         If the path is invalid.
     """
-    model = ConfigModel()
-    if not path:
-        return model.model_dump()
-    keys = path.split(".")
-    current: Any = model
-    for k in keys:
-        if hasattr(current, k):
-            current = getattr(current, k)
-        elif isinstance(current, dict) and k in current:  # pragma: no cover
+    current: Any = _DEFAULTS_DICT
+    if path:
+        for k in path.split("."):
+            if not isinstance(current, dict) or k not in current:
+                msg = f"Invalid config path: {path}"
+                raise KeyError(msg)
             current = current[k]
-        else:
-            msg = f"Invalid config path: {path}"
-            raise KeyError(msg)
-
-    if isinstance(current, BaseModel):
-        return current.model_dump()
-    return current
+    return copy.deepcopy(current)
 
 
 def reset_to_defaults(path: str | None = None) -> None:
@@ -190,8 +276,4 @@ def reset_to_defaults(path: str | None = None) -> None:
     if path is None:
         save_app_data(ConfigModel())
         return
-    data = load_app_data()
-    default_value = get_default_value_by_path(path)
-    _set_by_path(data, path, default_value)
-    settings = ConfigModel.model_validate(data)
-    save_app_data(settings)
+    set_setting(path, get_default_value_by_path(path))
@@ -4,11 +4,17 @@ This module contains the business logic for comparing local Confluence content
 with remote content and displaying differences.
 """
 
+import contextlib
 import logging
 import os
+import selectors
 import subprocess
+import sys
 import tempfile
+import time
+from collections.abc import Generator, Iterator
 from pathlib import Path
+from typing import IO, cast
 
 from atlassian import Confluence
 
@@ -18,6 +24,50 @@ from roundtripper.pull_service import PullService
 #: Logger instance.
 LOGGER = logging.getLogger(__name__)
 
+#: Maximal number of bytes of diff output read at once while streaming it to the pager.
+_DIFF_CHUNK_SIZE = 64 * 1024
+
+#: Seconds diff may take to produce its output, and again to exit once it was consumed.
+_DIFF_TIMEOUT = 30
+
+
+def _read_diff_output(stream: IO[bytes], timeout: float) -> Generator[bytes]:
+    """Yield the output of diff in chunks of at most ``_DIFF_CHUNK_SIZE`` bytes.
+
+    Only the time spent waiting for diff counts against ``timeout``, not the time the
+    consumer takes, e.g., while the pager is blocked on the user.
+
+    Parameters
+    ----------
+    stream
+        Unbuffered stdout pipe of the diff process.
+    timeout
+        Total number of seconds to wait for output.
+
+    Yields
+    ------
+    bytes
+        The next chunk of output.
+
+    Raises
+    ------
+    subprocess.TimeoutExpired
+        If diff did not finish its output in time.
+    """
+    remaining = timeout
+    with selectors.DefaultSelector() as selector:
+        selector.register(stream, selectors.EVENT_READ)
+        while True:
+            started = time.monotonic()
+            ready = selector.select(max(remaining, 0))
+            remaining -= time.monotonic() - started
+            if not ready:
+                raise subprocess.TimeoutExpired("diff", timeout)
+            chunk = stream.read(_DIFF_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
 
 class DiffService:
     """Service for comparing local and remote Confluence content."""
@@ -123,31 +173,51 @@ class DiffService:
         diff_cmd = [
             "diff",
             "-urN",  # unified format, recursive, show new files
-            "--color=always",  # colored output
+            # colored output, but no colors when redirected to a file or pipe
+            "--color=always" if sys.stdout.isatty() else "--color=never",
             "--exclude=*.json",  # exclude JSON metadata files
             str(local_path),
             str(remote_path),
         ]
 
         try:
-            # Run diff command
-            diff_result = subprocess.run(
-                diff_cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            # diff exits with 0 if no changes, 1 if changes found, >1 for errors
-            if diff_result.returncode > 1:
-                error_msg = f"Diff command failed: {diff_result.stderr}"
-                LOGGER.error(error_msg)
-                self.result.errors.append(error_msg)
-                return
-
-            diff_output = diff_result.stdout
-
-            if not diff_output:
+            # Stream diff output to the pager instead of buffering all of it; only the first
+            # chunk is read up front to tell whether there are any differences at all.
+            with (
+                tempfile.TemporaryFile() as diff_stderr,
+                subprocess.Popen(
+                    diff_cmd, stdout=subprocess.PIPE, stderr=diff_stderr, bufsize=0
+                ) as diff_process,
+            ):
+                diff_stdout = cast(IO[bytes], diff_process.stdout)
+                chunks = _read_diff_output(diff_stdout, _DIFF_TIMEOUT)
+                try:
+                    first_chunk = next(chunks, b"")
+                    if first_chunk:
+                        LOGGER.info("")
+                        LOGGER.info("=" * 70)
+                        LOGGER.info("Displaying differences")
+                        LOGGER.info("=" * 70)
+                        LOGGER.info("")
+                        self._page_diff(pager, first_chunk, chunks)
+                    # Closing the pipe stops diff if the pager was quit early
+                    chunks.close()
+                    diff_stdout.close()
+                    returncode = diff_process.wait(timeout=_DIFF_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    diff_process.kill()
+                    raise
+
+                # diff exits with 0 if no changes, 1 if changes found, >1 for errors
+                if returncode > 1:
+                    diff_stderr.seek(0)
+                    stderr = diff_stderr.read().decode("utf-8", errors="replace")
+                    error_msg = f"Diff command failed: {stderr}"
+                    LOGGER.error(error_msg)
+                    self.result.errors.append(error_msg)
+                    return
+
+            if not first_chunk:
                 LOGGER.info("")
                 LOGGER.info("=" * 70)
                 LOGGER.info("✓ No differences found")
@@ -158,28 +228,6 @@ class DiffService:
                 return
 
             self.result.has_differences = True
-
-            # Display through pager
-            LOGGER.info("")
-            LOGGER.info("=" * 70)
-            LOGGER.info("Displaying differences")
-            LOGGER.info("=" * 70)
-            LOGGER.info("")
-
-            pager_cmd = pager.split()
-            pager_process = subprocess.Popen(
-                pager_cmd,
-                stdin=subprocess.PIPE,
-                text=True,
-            )
-
-            pager_process.communicate(input=diff_output)
-
-            if pager_process.returncode != 0:
-                # Fallback to direct print if pager fails
-                LOGGER.warning("Pager failed, printing diff directly:")
-                print(diff_output)
-
         except subprocess.TimeoutExpired:
             error_msg = "Diff command timed out"
             LOGGER.error(error_msg)
@@ -193,3 +241,65 @@ class DiffService:
             error_msg = f"Error running diff: {e}"
             LOGGER.error(error_msg)
             self.result.errors.append(error_msg)
+
+    def _page_diff(self, pager: str, first_chunk: bytes, rest: Iterator[bytes]) -> None:
+        """Stream diff output through the pager, printing it directly if the pager fails.
+
+        The pager is skipped if stdout is not a terminal, e.g., when piped or in CI.
+
+        Parameters
+        ----------
+        pager
+            Pager command line.
+        first_chunk
+            First chunk of diff output.
+        rest
+            Remaining chunks of diff output.
+        """
+        if not sys.stdout.isatty():
+            self._print_diff(first_chunk, rest)
+            return
+
+        try:
+            pager_process = subprocess.Popen(pager.split(), stdin=subprocess.PIPE)
+        except OSError as e:
+            LOGGER.warning("Could not start pager '%s' (%s), printing diff directly:", pager, e)
+            self._print_diff(first_chunk, rest)
+            return
+        pager_stdin = cast(IO[bytes], pager_process.stdin)
+        chunks_sent = 0
+        pending = first_chunk
+        try:
+            with contextlib.suppress(BrokenPipeError):
+                while pending:
+                    pager_stdin.write(pending)
+                    chunks_sent += 1
+                    pending = next(rest, b"")
+        finally:
+            # Also let the user finish with the pager if diff timed out
+            with contextlib.suppress(BrokenPipeError):
+                pager_stdin.close()
+            pager_returncode = pager_process.wait()
+
+        if pager_returncode != 0:
+            # Fallback to direct print if pager fails; output beyond the first chunk that
+            # was already sent to the pager cannot be shown again.
+            LOGGER.warning("Pager failed, printing diff directly:")
+            self._print_diff(first_chunk + pending if chunks_sent == 1 else pending, rest)
+
+    def _print_diff(self, chunk: bytes, rest: Iterator[bytes]) -> None:
+        """Write diff output directly to stdout.
+
+        Parameters
+        ----------
+        chunk
+            First chunk of diff output.
+        rest
+            Remaining chunks of diff output.
+        """
+        sys.stdout.flush()
+        with contextlib.suppress(BrokenPipeError):
+            sys.stdout.buffer.write(chunk)
+            for pending in rest:
+                sys.stdout.buffer.write(pending)
+            sys.stdout.buffer.flush()
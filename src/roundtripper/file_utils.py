@@ -4,6 +4,8 @@ Adapted from confluence-markdown-exporter by Sebastian Penhouet.
 https://github.com/Spenhouet/confluence-markdown-exporter
 """
 
+import functools
+import hashlib
 import json
 import logging
 import re
@@ -17,9 +19,12 @@ from typing import Any
 LOGGER = logging.getLogger(__name__)
 
 
+@functools.cache
 def is_xmllint_available() -> bool:
     """Check if xmllint is available on the system.
 
+    The ``PATH`` lookup is done once per process, as ``format_xml`` asks for every page.
+
     Returns
     -------
     bool
@@ -117,6 +122,25 @@ def save_file(file_path: Path, content: str | bytes) -> None:
         raise TypeError(msg)
 
 
+def load_json(file_path: Path) -> dict[str, Any]:
+    """Load a JSON object from a file.
+
+    The file is read as bytes and handed to the parser in one piece, which avoids the
+    text decoding layer of ``json.load``.
+
+    Parameters
+    ----------
+    file_path
+        Path to the JSON file to read.
+
+    Returns
+    -------
+    dict[str, Any]
+        The parsed JSON data.
+    """
+    return json.loads(file_path.read_bytes())
+
+
 def save_json(file_path: Path, data: dict[str, Any]) -> None:
     """Save data as JSON to a file.
 
@@ -131,6 +155,60 @@ def save_json(file_path: Path, data: dict[str, Any]) -> None:
     save_file(file_path, content)
 
 
+def compute_content_hash(content: str | bytes) -> str:
+    """Compute SHA256 hash of content.
+
+    Parameters
+    ----------
+    content
+        Content to hash; strings are encoded as UTF-8.
+
+    Returns
+    -------
+    str
+        Hex digest of the hash.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def compute_page_hash(xml_content: str) -> str:
+    """Compute the hash of page XML, ignoring leading and trailing whitespace.
+
+    Push compares page content the same way, so whitespace-only edits at either end do
+    not count as changes.
+
+    Parameters
+    ----------
+    xml_content
+        Page XML content.
+
+    Returns
+    -------
+    str
+        Hex digest of the hash.
+    """
+    return compute_content_hash(xml_content.strip())
+
+
+def compute_file_hash(file_path: Path) -> str:
+    """Compute SHA256 hash of a file's content without reading it into memory at once.
+
+    Parameters
+    ----------
+    file_path
+        Path to the file to hash.
+
+    Returns
+    -------
+    str
+        Hex digest of the hash, equal to ``compute_content_hash`` of the file's bytes.
+    """
+    with file_path.open("rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize a filename for cross-platform compatibility.
 
@@ -4,6 +4,7 @@ Based on confluence-markdown-exporter by Sebastian Penhouet.
 https://github.com/Spenhouet/confluence-markdown-exporter
 """
 
+from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -254,6 +255,19 @@ class PushResult(BaseModel):
     errors: list[str] = Field(default_factory=list)
 
 
+class PagePlan(BaseModel):
+    """Analysis of a local page against the server, computed before pushing."""
+
+    page_path: Path
+    page_info: PageInfo | None = None
+    local_content: str = ""
+    server_content: str | None = None
+    server_raw_content: str = ""
+    changed: bool = False
+    conflict: str | None = None
+    error: str | None = None
+
+
 class DiffResult(BaseModel):
     """Result of a diff operation."""
 
@@ -4,18 +4,31 @@ This module contains the business logic for pulling Confluence content.
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from atlassian import Confluence
 from tqdm import tqdm
 
-from roundtripper.file_utils import build_page_path, format_xml, save_file, save_json
+from roundtripper.file_utils import (
+    build_page_path,
+    compute_content_hash,
+    compute_page_hash,
+    format_xml,
+    load_json,
+    save_file,
+    save_json,
+)
 from roundtripper.models import AttachmentInfo, PageInfo, PullResult, SpaceInfo
 
 #: Logger instance.
 LOGGER = logging.getLogger(__name__)
 
+#: Default number of pages fetched concurrently.
+DEFAULT_MAX_WORKERS = 8
+
 
 class PullService:
     """Service for pulling Confluence content to local storage."""
@@ -26,6 +39,7 @@ class PullService:
         output_dir: Path,
         *,
         dry_run: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> None:
         """Initialize the pull service.
 
@@ -37,12 +51,19 @@ class PullService:
             Base output directory for downloaded content.
         dry_run
             If True, only show what would be downloaded without actually downloading.
+        max_workers
+            Maximum number of pages fetched concurrently.
         """
         self.client = client
         self.output_dir = output_dir
         self.dry_run = dry_run
+        self.max_workers = max_workers
+        # Instance URL without trailing slash, for joining with API link paths
+        self.base_url = str(client.url).rstrip("/")
         self.result = PullResult()
         self._ancestor_cache: dict[int, str] = {}
+        # Guards ``self.result`` while pages are pulled from worker threads
+        self._result_lock = threading.Lock()
 
     def pull_space(self, space_key: str) -> PullResult:
         """Pull all pages from a Confluence space.
@@ -77,9 +98,7 @@ class PullService:
         LOGGER.info("Found %d pages to pull", len(page_ids))
         LOGGER.info("Starting download...")
 
-        # Pull each page with progress bar
-        for page_id in tqdm(page_ids, desc="Pulling pages", disable=self.dry_run):
-            self._pull_page(page_id)
+        self._pull_pages(page_ids)
 
         return self.result
 
@@ -105,13 +124,29 @@ class PullService:
             LOGGER.info("Found %d pages to pull (including descendants)", len(page_ids))
             LOGGER.info("Starting download...")
 
-            for pid in tqdm(page_ids, desc="Pulling pages", disable=self.dry_run):
-                self._pull_page(pid)
+            self._pull_pages(page_ids)
         else:
             self._pull_page(page_id)
 
         return self.result
 
+    def _pull_pages(self, page_ids: list[int]) -> None:
+        """Pull several pages concurrently with a progress bar.
+
+        Parameters
+        ----------
+        page_ids
+            The page IDs to pull.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for _ in tqdm(
+                executor.map(self._pull_page, page_ids),
+                total=len(page_ids),
+                desc="Pulling pages",
+                disable=self.dry_run,
+            ):
+                pass
+
     def _get_all_descendant_ids(self, page_id: int) -> list[int]:
         """Get all descendant page IDs for a given page.
 
@@ -173,7 +208,8 @@ class PullService:
         except Exception as e:
             error_msg = f"Failed to fetch page {page_id}: {e}"
             LOGGER.warning(error_msg)
-            self.result.errors.append(error_msg)
+            with self._result_lock:
+                self.result.errors.append(error_msg)
             return
 
         # Get ancestor titles for building path
@@ -189,20 +225,23 @@ class PullService:
 
         if self.dry_run:
             LOGGER.info("[DRY RUN] Would create: %s", page_dir)
-            self.result.pages_downloaded += 1
+            with self._result_lock:
+                self.result.pages_downloaded += 1
             return
 
         # Check if page already exists with same version
         page_json_path = page_dir / "page.json"
         if self._is_up_to_date(page_json_path, page.version.number):
             LOGGER.debug("Page '%s' is up to date, skipping", page.title)
-            self.result.pages_skipped += 1
+            with self._result_lock:
+                self.result.pages_skipped += 1
         else:
             # Save page content (Confluence storage format)
             LOGGER.debug("Saving page content to: %s", page_dir)
             self._save_page_content(page_dir, page)
             LOGGER.info("Downloaded: %s", page.title)
-            self.result.pages_downloaded += 1
+            with self._result_lock:
+                self.result.pages_downloaded += 1
 
         # Pull attachments
         self._pull_attachments(page_id, page_dir)
@@ -256,10 +295,7 @@ class PullService:
             return False
 
         try:
-            import json
-
-            with json_path.open("r") as f:
-                existing_data = json.load(f)
+            existing_data = load_json(json_path)
             existing_version = existing_data.get("version", {}).get("number", 0)
             return existing_version >= current_version
         except Exception:  # pragma: no cover
@@ -280,9 +316,13 @@ class PullService:
         formatted_xml = format_xml(page.body_storage)
         save_file(xml_path, formatted_xml)
 
-        # Save raw API response
+        # Save raw API response, with the hash of the XML so push can detect local edits
         json_path = page_dir / "page.json"
-        save_json(json_path, page.raw_api_response)
+        metadata = {
+            **page.raw_api_response,
+            "local_content_hash": compute_page_hash(formatted_xml),
+        }
+        save_json(json_path, metadata)
 
         LOGGER.debug("Saved page: %s", page.title)
 
@@ -345,18 +385,20 @@ class PullService:
 
         if self.dry_run:  # pragma: no cover
             LOGGER.info("[DRY RUN] Would download: %s", filename)
-            self.result.attachments_downloaded += 1
+            with self._result_lock:
+                self.result.attachments_downloaded += 1
             return
 
         # Check if attachment is up to date
         if self._is_attachment_up_to_date(json_path, attachment.version.number):
             LOGGER.debug("Attachment '%s' is up to date, skipping", filename)
-            self.result.attachments_skipped += 1
+            with self._result_lock:
+                self.result.attachments_skipped += 1
             return
 
         # Download attachment content
         try:
-            download_url = str(self.client.url) + attachment.download_link
+            download_url = self.base_url + attachment.download_link
             LOGGER.debug("Downloading attachment: %s", filename)
             response = self.client._session.get(download_url)
             response.raise_for_status()
@@ -365,14 +407,20 @@ class PullService:
         except Exception as e:
             error_msg = f"Failed to download attachment '{filename}': {e}"
             LOGGER.warning(error_msg)
-            self.result.errors.append(error_msg)
+            with self._result_lock:
+                self.result.errors.append(error_msg)
             return
 
         # Save attachment and metadata
         save_file(file_path, content)
-        save_json(json_path, attachment.raw_api_response)
+        metadata = {
+            **attachment.raw_api_response,
+            "local_content_hash": compute_content_hash(content),
+        }
+        save_json(json_path, metadata)
 
-        self.result.attachments_downloaded += 1
+        with self._result_lock:
+            self.result.attachments_downloaded += 1
         LOGGER.info("Downloaded attachment: %s", filename)
 
     def _is_attachment_up_to_date(self, json_path: Path, current_version: int) -> bool:
@@ -394,10 +442,7 @@ class PullService:
             return False
 
         try:
-            import json
-
-            with json_path.open("r") as f:
-                existing_data = json.load(f)
+            existing_data = load_json(json_path)
             existing_version = existing_data.get("version", {}).get("number", 0)
             return existing_version >= current_version
         except Exception:  # pragma: no cover
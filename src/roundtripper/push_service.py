@@ -4,21 +4,59 @@ This module contains the business logic for pushing Confluence content.
 """
 
 import difflib
-import hashlib
-import json
 import logging
+import os
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any
 
 from atlassian import Confluence
 from tqdm import tqdm
 
-from roundtripper.file_utils import format_xml
-from roundtripper.models import PageInfo, PushResult
-from roundtripper.pull_service import PullService
+from roundtripper.file_utils import (
+    compute_file_hash,
+    compute_page_hash,
+    format_xml,
+    load_json,
+    save_file,
+    save_json,
+)
+from roundtripper.models import PageInfo, PagePlan, PushResult
+from roundtripper.pull_service import DEFAULT_MAX_WORKERS, PullService
 
 #: Logger instance.
 LOGGER = logging.getLogger(__name__)
 
+#: ANSI escape sequence ending a colored diff line.
+_ANSI_RESET = b"\033[0m"
+
+
+def _diff_line_color(line: bytes) -> bytes:
+    """Return the ANSI escape sequence to color a unified diff line with.
+
+    Parameters
+    ----------
+    line
+        The encoded diff line.
+
+    Returns
+    -------
+    bytes
+        Bold for file headers, green for additions, red for removals, cyan for hunk
+        headers, and nothing for context lines.
+    """
+    if line.startswith((b"+++", b"---")):
+        return b"\033[1m"
+    if line.startswith(b"+"):
+        return b"\033[32m"
+    if line.startswith(b"-"):
+        return b"\033[31m"
+    if line.startswith(b"@@"):
+        return b"\033[36m"
+    return b""
+
 
 class PushService:
     """Service for pushing local content to Confluence."""
@@ -31,6 +69,7 @@ class PushService:
         dry_run: bool = False,
         force: bool = False,
         interactive: bool = True,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> None:
         """Initialize the push service.
 
@@ -46,12 +85,15 @@ class PushService:
             If True, push even if there are version conflicts.
         interactive
             If True, prompt for confirmation before updating each page.
+        max_workers
+            Maximum number of pages analyzed against the server concurrently.
         """
         self.client = client
         self.message = message
         self.dry_run = dry_run
         self.force = force
         self.interactive = interactive
+        self.max_workers = max_workers
         self.result = PushResult()
 
     def push_page(self, page_path: Path, *, recursive: bool = False) -> PushResult:
@@ -71,7 +113,6 @@ class PushService:
         """
         LOGGER.debug("Starting push_page: path=%s, recursive=%s", page_path, recursive)
         LOGGER.info("Analyzing page at: %s", page_path)
-        self._push_page_at_path(page_path)
 
         if recursive:
             LOGGER.info("Discovering child pages for recursive push...")
@@ -79,8 +120,9 @@ class PushService:
             LOGGER.debug("Found %d child pages to push", len(child_pages))
             if child_pages:
                 LOGGER.info("Found %d child pages, starting push...", len(child_pages))
-            for child_path in tqdm(child_pages, desc="Pushing child pages", disable=self.dry_run):
-                self._push_page_at_path(child_path)
+            self._push_pages([page_path, *child_pages])
+        else:
+            self._push_page_at_path(page_path)
 
         return self.result
 
@@ -101,14 +143,39 @@ class PushService:
         LOGGER.info("Discovering all pages in space directory...")
         all_pages = self._find_all_pages(space_path)
         LOGGER.info("Found %d pages to analyze", len(all_pages))
-        LOGGER.debug("Page paths: %s", [str(p) for p in all_pages])
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Page paths: %s", [str(p) for p in all_pages])
         LOGGER.info("Starting push operations...")
 
-        for page_path in tqdm(all_pages, desc="Pushing pages", disable=self.dry_run):
-            self._push_page_at_path(page_path)
+        self._push_pages(all_pages)
 
         return self.result
 
+    def _push_pages(self, page_paths: list[Path]) -> None:
+        """Push several pages, analyzing them concurrently and applying them in order.
+
+        The server round trips of the analysis phase run in a thread pool; updates,
+        prompts, and result bookkeeping happen sequentially on the calling thread.
+
+        Parameters
+        ----------
+        page_paths
+            Paths to the page directories.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            plans = list(
+                tqdm(
+                    executor.map(self._plan_page, page_paths),
+                    total=len(page_paths),
+                    desc="Analyzing pages",
+                    disable=self.dry_run,
+                )
+            )
+
+        for plan in tqdm(plans, desc="Pushing pages", disable=self.dry_run):
+            if plan is not None:
+                self._apply_plan(plan)
+
     def _push_page_at_path(self, page_path: Path) -> None:
         """Push a single page at the given path.
 
@@ -117,19 +184,37 @@ class PushService:
         page_path
             Path to the page directory.
         """
+        plan = self._plan_page(page_path)
+        if plan is not None:
+            self._apply_plan(plan)
+
+    def _plan_page(self, page_path: Path) -> PagePlan | None:
+        """Load a local page and compare it with the server without modifying anything.
+
+        This is safe to call from worker threads as it does not touch ``self.result``.
+
+        Parameters
+        ----------
+        page_path
+            Path to the page directory.
+
+        Returns
+        -------
+        PagePlan | None
+            The analysis result, or None if the directory is not a complete page.
+        """
         xml_file = page_path / "page.xml"
         json_file = page_path / "page.json"
 
         if not xml_file.exists() or not json_file.exists():
             LOGGER.warning("Skipping %s: missing page.xml or page.json", page_path)
-            return
+            return None
 
         try:
             # Load local content and metadata
             LOGGER.debug("Loading page files from %s", page_path)
             local_content = xml_file.read_text(encoding="utf-8")
-            with json_file.open(encoding="utf-8") as f:
-                local_metadata = json.load(f)
+            local_metadata = load_json(json_file)
 
             page_info = PageInfo.from_api_response(local_metadata)
             LOGGER.debug(
@@ -139,22 +224,68 @@ class PushService:
                 page_info.version.number,
             )
 
+            # Content identical to what the last pull wrote needs no server round trip
+            stored_hash = local_metadata.get("local_content_hash")
+            if stored_hash == compute_page_hash(local_content):
+                LOGGER.debug("Skipping server check for %s: unchanged since pull", page_info.title)
+                return PagePlan(page_path=page_path, page_info=page_info)
+
             # Check if content has changed and get server content for diff
             LOGGER.debug("Checking if content has changed for: %s", page_info.title)
-            server_content = self._get_server_content(page_info)
-            if not self._has_content_changed_with_server(local_content, server_content):
-                LOGGER.debug("Skipping %s: content unchanged", page_info.title)
-                self.result.pages_skipped += 1
-                return
+            server_version, server_raw_content = self._get_server_content(page_info)
+            if stored_hash is not None and server_raw_content == page_info.body_storage:
+                # The server still has what the last pull formatted into page.xml, and the
+                # hash shows the local file was edited since, so formatting can wait for a diff
+                server_content = None
+            else:
+                server_content = format_xml(server_raw_content)
+                if not self._has_content_changed_with_server(local_content, server_content):
+                    return PagePlan(page_path=page_path, page_info=page_info)
 
             # Check for version conflicts
             LOGGER.debug("Checking version conflict for page %d", page_info.id)
-            conflict = self._check_version_conflict(page_info)
-            if conflict and not self.force:
-                LOGGER.debug("Version conflict detected: %s", conflict)
-                self.result.conflicts.append(conflict)
-                return
+            return PagePlan(
+                page_path=page_path,
+                page_info=page_info,
+                local_content=local_content,
+                server_content=server_content,
+                server_raw_content=server_raw_content,
+                changed=True,
+                conflict=self._check_version_conflict(page_info, server_version),
+            )
+        except Exception as e:
+            return PagePlan(page_path=page_path, error=f"Failed to push {page_path}: {e}")
+
+    def _apply_plan(self, plan: PagePlan) -> None:
+        """Push a previously analyzed page and record the outcome.
+
+        Parameters
+        ----------
+        plan
+            The analysis result from ``_plan_page``.
+        """
+        page_path = plan.page_path
+        if plan.error is not None:
+            LOGGER.warning(plan.error)
+            self.result.errors.append(plan.error)
+            return
+
+        page_info = plan.page_info
+        assert page_info is not None  # set whenever there is no error
+        local_content = plan.local_content
+        conflict = plan.conflict
 
+        if not plan.changed:
+            LOGGER.debug("Skipping %s: content unchanged", page_info.title)
+            self.result.pages_skipped += 1
+            return
+
+        if conflict and not self.force:
+            LOGGER.debug("Version conflict detected: %s", conflict)
+            self.result.conflicts.append(conflict)
+            return
+
+        try:
             # Push the page
             if self.dry_run:
                 if conflict:
@@ -172,11 +303,11 @@ class PushService:
                         page_info.version.number + 1,
                     )
                 # Show diff in dry-run mode
-                self._show_diff(page_info.title, server_content, local_content)
+                self._show_diff(page_info.title, self._plan_server_content(plan), local_content)
             else:
                 # Show diff if interactive mode
                 if self.interactive:
-                    self._show_diff(page_info.title, server_content, local_content)
+                    self._show_diff(page_info.title, self._plan_server_content(plan), local_content)
                     LOGGER.info("")
                     response = input(f"Update '{page_info.title}'? [Y/n/q]: ").strip().lower()
                     if response == "q":
@@ -193,7 +324,7 @@ class PushService:
                     page_info.id,
                     page_info.title,
                 )
-                self._update_page(page_info, local_content)
+                response = self._update_page(page_info, local_content)
                 LOGGER.info(
                     "✓ Updated: %s (v%d → v%d)",
                     page_info.title,
@@ -202,9 +333,11 @@ class PushService:
                 )
                 self.result.pages_updated += 1
 
-                # Immediately refresh local files to avoid version conflicts next time
-                LOGGER.debug("Refreshing local files after push: %s", page_path)
-                self._refresh_local_page(page_info.id, page_path)
+                # Immediately refresh local files to avoid version conflicts next time,
+                # from the update response if possible and by pulling the page otherwise
+                if not self._save_updated_page(page_info, page_path, response):
+                    LOGGER.debug("Refreshing local files after push: %s", page_path)
+                    self._refresh_local_page(page_info.id, page_path)
 
             # Handle attachments
             self._push_attachments(page_path, page_info.id)
@@ -214,8 +347,25 @@ class PushService:
             LOGGER.warning(error_msg)
             self.result.errors.append(error_msg)
 
-    def _get_server_content(self, page_info: PageInfo) -> str:
-        """Fetch current content from server.
+    def _plan_server_content(self, plan: PagePlan) -> str:
+        """Return the server content of a plan formatted for display, formatting it if needed.
+
+        Parameters
+        ----------
+        plan
+            The analysis result from ``_plan_page``.
+
+        Returns
+        -------
+        str
+            Server content formatted like the local page.xml.
+        """
+        if plan.server_content is None:
+            return format_xml(plan.server_raw_content)
+        return plan.server_content
+
+    def _get_server_content(self, page_info: PageInfo) -> tuple[int | None, str]:
+        """Fetch current version and content from server with a single request.
 
         Parameters
         ----------
@@ -224,8 +374,9 @@ class PushService:
 
         Returns
         -------
-        str
-            Server content or stored content as fallback, formatted for comparison.
+        tuple[int | None, str]
+            Server version number (None if the server could not be reached) and unformatted
+            server content or stored content as fallback.
         """
         try:
             # Fetch current content from server with storage format
@@ -233,17 +384,17 @@ class PushService:
                 page_info.id, expand="body.storage,version"
             )
             assert isinstance(server_response, dict)
+            server_version = server_response.get("version", {}).get("number", 0)
             server_content = server_response.get("body", {}).get("storage", {}).get("value", "")
-            # Format server XML to match local formatted XML for accurate comparison
-            return format_xml(server_content)
-        except Exception as e:  # pragma: no cover
+            return server_version, server_content
+        except Exception as e:
             # If we can't fetch from server, fall back to stored content
             LOGGER.warning(
                 "Could not fetch server content for page %d: %s. Using stored content.",
                 page_info.id,
                 e,
             )
-            return page_info.body_storage
+            return None, page_info.body_storage
 
     def _has_content_changed_with_server(self, local_content: str, server_content: str) -> bool:
         """Check if local content differs from server content.
@@ -298,19 +449,31 @@ class PushService:
             LOGGER.info("Diff for: %s", title)
             LOGGER.info("=" * 70)
             LOGGER.info("")
+            if not sys.stdout.isatty():
+                # No colors when redirected to a file or pipe
+                sys.stdout.write("".join(line.removesuffix("\n") + "\n" for line in diff_lines))
+                # Separate the diff from what follows, e.g., the prompt
+                sys.stdout.write("\n")
+                sys.stdout.flush()
+                return
+
+            # Color the diff output and write it in one go
+            parts: list[bytes] = []
             for line in diff_lines:
-                # Color the diff output
-                if line.startswith("+++") or line.startswith("---"):
-                    print(f"\033[1m{line}\033[0m", end="")  # Bold
-                elif line.startswith("+"):
-                    print(f"\033[32m{line}\033[0m", end="")  # Green
-                elif line.startswith("-"):
-                    print(f"\033[31m{line}\033[0m", end="")  # Red
-                elif line.startswith("@@"):
-                    print(f"\033[36m{line}\033[0m", end="")  # Cyan
-                else:  # pragma: no cover
-                    print(line, end="")
-            print()
+                encoded = line.removesuffix("\n").encode("utf-8")
+                color = _diff_line_color(encoded)
+                parts += (color, encoded, _ANSI_RESET, b"\n") if color else (encoded, b"\n")
+            parts.append(b"\n")
+            colored = b"".join(parts)
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is None:
+                # Some replacement streams, e.g., in IDE consoles, only accept text
+                sys.stdout.write(colored.decode("utf-8"))
+                sys.stdout.flush()
+                return
+            sys.stdout.flush()
+            buffer.write(colored)
+            buffer.flush()
 
     def _refresh_local_page(self, page_id: int, page_path: Path) -> None:
         """Refresh local page files after successful push.
@@ -332,42 +495,42 @@ class PushService:
             LOGGER.warning("Failed to refresh local files after push: %s", e)
             LOGGER.warning("You may need to manually pull this page to avoid version conflicts")
 
-    def _check_version_conflict(self, page_info: PageInfo) -> str | None:
+    def _check_version_conflict(
+        self, page_info: PageInfo, server_version: int | None
+    ) -> str | None:
         """Check if server version is newer than local metadata.
 
         Parameters
         ----------
         page_info
             Page metadata from local JSON.
+        server_version
+            Version number fetched along with the server content, or None if unknown.
 
         Returns
         -------
         str | None
             Conflict message if conflict detected, None otherwise.
         """
-        try:
-            server_response = self.client.get_page_by_id(page_info.id, expand="version")
-            assert isinstance(server_response, dict)
-            server_version = server_response.get("version", {}).get("number", 0)
-            LOGGER.debug(
-                "Version check: page_id=%d, local=%d, server=%d",
-                page_info.id,
-                page_info.version.number,
-                server_version,
-            )
-
-            if server_version > page_info.version.number:
-                return (
-                    f"Conflict: {page_info.title} - "
-                    f"local version {page_info.version.number}, "
-                    f"server version {server_version}"
-                )
-        except Exception as e:
-            LOGGER.debug("Could not check version for page %d: %s", page_info.id, e)
+        if server_version is None:
+            LOGGER.debug("Could not check version for page %d", page_info.id)
+            return None
 
+        LOGGER.debug(
+            "Version check: page_id=%d, local=%d, server=%d",
+            page_info.id,
+            page_info.version.number,
+            server_version,
+        )
+        if server_version > page_info.version.number:
+            return (
+                f"Conflict: {page_info.title} - "
+                f"local version {page_info.version.number}, "
+                f"server version {server_version}"
+            )
         return None
 
-    def _update_page(self, page_info: PageInfo, content: str) -> None:
+    def _update_page(self, page_info: PageInfo, content: str) -> object:
         """Update a page on Confluence.
 
         Parameters
@@ -376,13 +539,18 @@ class PushService:
             Page metadata.
         content
             New content to push.
+
+        Returns
+        -------
+        object
+            The API response, normally the updated page as a dictionary.
         """
         LOGGER.debug(
             "Calling Confluence API update_page: page_id=%d, title=%s",
             page_info.id,
             page_info.title,
         )
-        self.client.update_page(
+        response = self.client.update_page(
             page_id=page_info.id,
             title=page_info.title,
             body=content,
@@ -390,6 +558,49 @@ class PushService:
             version_comment=self.message,
         )
         LOGGER.debug("API call successful for page %d", page_info.id)
+        return response
+
+    def _save_updated_page(self, page_info: PageInfo, page_path: Path, response: object) -> bool:
+        """Rewrite the local page files from the update response instead of pulling the page.
+
+        As after a pull, page.xml holds the body as stored by the server, which may differ
+        from the pushed content, e.g., by IDs that Confluence adds to elements.
+
+        Parameters
+        ----------
+        page_info
+            Page metadata as loaded before the push.
+        page_path
+            Path to the page directory.
+        response
+            The response of the update API call.
+
+        Returns
+        -------
+        bool
+            True if the files were rewritten, False if the response lacks the new version
+            or body.
+        """
+        if not isinstance(response, dict):
+            return False
+        version = response.get("version")
+        if not isinstance(version, dict) or "number" not in version:
+            return False
+        storage = response.get("body", {}).get("storage")
+        if not isinstance(storage, dict) or "value" not in storage:
+            return False
+
+        formatted_xml = format_xml(storage["value"])
+        save_file(page_path / "page.xml", formatted_xml)
+        metadata = {
+            **page_info.raw_api_response,
+            "version": version,
+            "body": {**page_info.raw_api_response.get("body", {}), "storage": storage},
+            "local_content_hash": compute_page_hash(formatted_xml),
+        }
+        save_json(page_path / "page.json", metadata)
+        LOGGER.debug("Updated local files to version %d", version["number"])
+        return True
 
     def _push_attachments(self, page_path: Path, page_id: int) -> None:
         """Push attachments for a page.
@@ -412,6 +623,7 @@ class PushService:
         if attachment_files:
             LOGGER.info("Analyzing %d attachments...", len(attachment_files))
 
+        to_upload: list[tuple[Path, Path]] = []
         for attachment_file in attachment_files:
             metadata_file = attachment_file.with_suffix(attachment_file.suffix + ".json")
 
@@ -419,17 +631,54 @@ class PushService:
                 if self.dry_run:
                     LOGGER.info("📎 WOULD UPLOAD: %s", attachment_file.name)
                 else:
-                    LOGGER.debug(
-                        "Uploading attachment: %s to page %d", attachment_file.name, page_id
-                    )
-                    LOGGER.info("Uploading: %s", attachment_file.name)
-                    self._upload_attachment(page_id, attachment_file)
-                    LOGGER.info("✓ Uploaded: %s", attachment_file.name)
-                    self.result.attachments_uploaded += 1
+                    to_upload.append((attachment_file, metadata_file))
             else:
                 LOGGER.debug("Skipping unchanged attachment: %s", attachment_file.name)
                 self.result.attachments_skipped += 1
 
+        if not to_upload:
+            return
+
+        # Uploads are independent round trips; results are counted on this thread, and a
+        # failed upload is recorded without affecting the others
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._upload_and_record_attachment, page_id, attachment_file, metadata_file
+                ): attachment_file
+                for attachment_file, metadata_file in to_upload
+            }
+            for future in as_completed(futures):
+                attachment_file = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    error_msg = f"Failed to upload attachment {attachment_file}: {e}"
+                    LOGGER.warning(error_msg)
+                    self.result.errors.append(error_msg)
+                else:
+                    LOGGER.info("✓ Uploaded: %s", attachment_file.name)
+                    self.result.attachments_uploaded += 1
+
+    def _upload_and_record_attachment(
+        self, page_id: int, attachment_file: Path, metadata_file: Path
+    ) -> None:
+        """Upload an attachment and update its metadata JSON.
+
+        Parameters
+        ----------
+        page_id
+            Confluence page ID.
+        attachment_file
+            Path to the attachment file.
+        metadata_file
+            Path to the attachment metadata JSON file.
+        """
+        LOGGER.debug("Uploading attachment: %s to page %d", attachment_file.name, page_id)
+        LOGGER.info("Uploading: %s", attachment_file.name)
+        self._upload_attachment(page_id, attachment_file)
+        self._record_uploaded_attachment(attachment_file, metadata_file)
+
     def _should_push_attachment(self, attachment_file: Path, metadata_file: Path) -> bool:
         """Check if an attachment should be pushed.
 
@@ -449,14 +698,36 @@ class PushService:
             # New attachment, should push
             return True
 
-        # Compare file hash with stored metadata
-        with metadata_file.open(encoding="utf-8") as f:
-            metadata = json.load(f)
+        metadata = load_json(metadata_file)
 
+        # A size mismatch is conclusive without reading the file
         stored_size = metadata.get("extensions", {}).get("fileSize", 0)
         current_size = attachment_file.stat().st_size
+        if current_size != stored_size:
+            return True
 
-        return current_size != stored_size
+        # Same size: compare content hashes when one was recorded at pull or upload time
+        stored_hash = metadata.get("local_content_hash")
+        if stored_hash is None:
+            return False
+        return compute_file_hash(attachment_file) != stored_hash
+
+    def _record_uploaded_attachment(self, attachment_file: Path, metadata_file: Path) -> None:
+        """Update the attachment metadata JSON with the size and hash of the uploaded file.
+
+        Parameters
+        ----------
+        attachment_file
+            Path to the attachment file that was uploaded.
+        metadata_file
+            Path to the attachment metadata JSON file, created if missing.
+        """
+        metadata: dict[str, Any] = {}
+        if metadata_file.exists():
+            metadata = load_json(metadata_file)
+        metadata.setdefault("extensions", {})["fileSize"] = attachment_file.stat().st_size
+        metadata["local_content_hash"] = compute_file_hash(attachment_file)
+        save_json(metadata_file, metadata)
 
     def _upload_attachment(self, page_id: int, attachment_file: Path) -> None:
         """Upload an attachment to a page.
@@ -487,17 +758,7 @@ class PushService:
         list[Path]
             List of paths to child page directories.
         """
-        child_pages: list[Path] = []
-
-        for item in page_path.iterdir():
-            if item.is_dir() and item.name != "attachments":
-                xml_file = item / "page.xml"
-                if xml_file.exists():
-                    child_pages.append(item)
-                    # Recursively find grandchildren
-                    child_pages.extend(self._find_child_pages(item))
-
-        return child_pages
+        return list(self._walk_pages(page_path, pages_only=True))
 
     def _find_all_pages(self, space_path: Path) -> list[Path]:
         """Find all page directories in a space.
@@ -512,33 +773,42 @@ class PushService:
         list[Path]
             List of paths to all page directories.
         """
-        all_pages: list[Path] = []
+        return list(self._walk_pages(space_path))
 
-        def find_pages_recursive(directory: Path) -> None:
-            for item in directory.iterdir():
-                if item.is_dir():
-                    xml_file = item / "page.xml"
-                    if xml_file.exists():
-                        all_pages.append(item)
-                    # Always search subdirectories (except attachments)
-                    if item.name != "attachments":
-                        find_pages_recursive(item)
+    def _walk_pages(self, root: Path, *, pages_only: bool = False) -> Iterator[Path]:
+        """Yield the page directories below a directory.
 
-        find_pages_recursive(space_path)
-        return all_pages
+        Pages are yielded depth-first in name order, so every page comes before its
+        descendants and the order is the same on every run. ``attachments`` directories
+        and symlinked directories are not searched.
 
-
-def compute_content_hash(content: str) -> str:
-    """Compute SHA256 hash of content.
-
-    Parameters
-    ----------
-    content
-        Content to hash.
-
-    Returns
-    -------
-    str
-        Hex digest of the hash.
-    """
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        Parameters
+        ----------
+        root
+            Directory to search; it is not yielded itself.
+        pages_only
+            Only descend into directories that are pages themselves.
+
+        Yields
+        ------
+        Path
+            Paths to page directories, i.e. directories containing a page.xml.
+        """
+        root_dir = os.fspath(root)
+        # Iterative scandir walk: directory entries carry their type, so no extra stat per item
+        stack = [root_dir]
+        while stack:
+            directory = stack.pop()
+            if directory != root_dir:
+                if os.path.exists(os.path.join(directory, "page.xml")):
+                    yield Path(directory)
+                elif pages_only:
+                    continue
+            with os.scandir(directory) as entries:
+                subdirs = sorted(
+                    entry.path
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False) and entry.name != "attachments"
+                )
+            # Push in reverse so the alphabetically first directory is visited next
+            stack.extend(reversed(subdirs))
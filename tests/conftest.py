@@ -1,4 +1,20 @@
 import os
 
+import pytest
+
+from roundtripper.api_client import clear_client_cache
+from roundtripper.config_store import invalidate_settings
+
 # Fix the global timezone in all tests to UTC.
 os.environ["TZ"] = "UTC"
+
+
+@pytest.fixture(autouse=True)
+def _reset_module_caches() -> None:
+    """Start every test without cached clients or settings.
+
+    Keeps tests independent of the order they run in, and of which worker runs them when
+    the suite is distributed across processes.
+    """
+    clear_client_cache()
+    invalidate_settings()
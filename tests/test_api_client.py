@@ -1,14 +1,46 @@
 """Tests for API client factory."""
 
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
+from atlassian import Confluence as ConfluenceApiSdk
 from pydantic import AnyHttpUrl, SecretStr
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
 
-from roundtripper.api_client import ConfluenceClientFactory, get_confluence_client
+from roundtripper import api_client
+from roundtripper.api_client import (
+    ConfluenceClientFactory,
+    PrecomputedBasicAuth,
+    clear_client_cache,
+    get_confluence_client,
+)
 from roundtripper.config import ApiDetails
 
 
+@pytest.fixture
+def mock_settings() -> Iterator[MagicMock]:
+    """Patch the settings to connect to https://example.com with a PAT."""
+    with patch("roundtripper.api_client.get_settings") as mock_get_settings:
+        settings = MagicMock()
+        settings.auth.confluence = ApiDetails(
+            url=AnyHttpUrl("https://example.com"),
+            pat=SecretStr("token"),
+        )
+        settings.connection_config.model_dump.return_value = {}
+        mock_get_settings.return_value = settings
+        yield settings
+
+
+@pytest.fixture
+def mock_confluence_class() -> Iterator[MagicMock]:
+    """Patch the Confluence SDK class used to create clients."""
+    with patch("roundtripper.api_client.ConfluenceApiSdk") as confluence_class:
+        yield confluence_class
+
+
 class TestConfluenceClientFactory:
     """Tests for ConfluenceClientFactory."""
 
@@ -65,6 +97,76 @@ class TestConfluenceClientFactory:
                 **connection_config,
             )
 
+    def test_create_mounts_pooled_adapter(self) -> None:
+        """Test that the session gets a sized connection pool and keeps the SDK retries."""
+        auth = ApiDetails(
+            url=AnyHttpUrl("https://confluence.example.com"),
+            pat=SecretStr("pat-token-123"),
+        )
+        factory = ConfluenceClientFactory(
+            {"backoff_and_retry": True, "max_backoff_retries": 3, "pool_maxsize": 16}
+        )
+
+        with patch.object(ConfluenceApiSdk, "get_all_spaces"):
+            client = factory.create(auth)
+
+        adapter = client._session.get_adapter("https://confluence.example.com/rest/api/space")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 16
+        assert adapter.max_retries.status == 3
+        assert adapter.max_retries.connect == 3
+        assert adapter.max_retries.backoff_jitter > 0
+
+    def test_create_without_retry_keeps_default_adapter_policy(self) -> None:
+        """Test that connection errors are not retried when retries are disabled."""
+        auth = ApiDetails(
+            url=AnyHttpUrl("https://confluence.example.com"),
+            pat=SecretStr("pat-token-123"),
+        )
+        factory = ConfluenceClientFactory({"backoff_and_retry": False})
+
+        with patch.object(ConfluenceApiSdk, "get_all_spaces"):
+            client = factory.create(auth)
+
+        adapter = client._session.get_adapter("https://confluence.example.com/rest/api/space")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter.max_retries.total == 0
+        assert not adapter.max_retries.status
+
+    def test_create_precomputes_basic_auth_header(self) -> None:
+        """Test that Basic authentication uses a header encoded once."""
+        auth = ApiDetails(
+            url=AnyHttpUrl("https://confluence.example.com"),
+            username=SecretStr("user@example.com"),
+            api_token=SecretStr("test-token"),
+        )
+        factory = ConfluenceClientFactory({})
+
+        with patch.object(ConfluenceApiSdk, "get_all_spaces"):
+            client = factory.create(auth)
+
+        assert isinstance(client._session.auth, PrecomputedBasicAuth)
+        expected = HTTPBasicAuth("user@example.com", "test-token")(
+            requests.Request("GET", "https://confluence.example.com/").prepare()
+        )
+        request = client._session.prepare_request(
+            requests.Request("GET", "https://confluence.example.com/rest/api/space")
+        )
+        assert request.headers["Authorization"] == expected.headers["Authorization"]
+
+    def test_create_without_connection_test(self) -> None:
+        """Test that the connection test can be skipped."""
+        auth = ApiDetails(
+            url=AnyHttpUrl("https://confluence.example.com"),
+            pat=SecretStr("pat-token-123"),
+        )
+        factory = ConfluenceClientFactory({})
+
+        with patch("roundtripper.api_client.ConfluenceApiSdk") as mock_confluence_class:
+            factory.create(auth, test_connection=False)
+
+            mock_confluence_class.return_value.get_all_spaces.assert_not_called()
+
     def test_create_raises_connection_error(self) -> None:
         """Test that connection errors are raised properly."""
         auth = ApiDetails(
@@ -81,6 +183,18 @@ class TestConfluenceClientFactory:
             with pytest.raises(ConnectionError, match="Confluence connection failed"):
                 factory.create(auth)
 
+    def test_create_raises_connection_error_on_invalid_client(self) -> None:
+        """Test that errors while setting up the client are raised as ConnectionError."""
+        auth = ApiDetails(
+            url=AnyHttpUrl("https://example.com"),
+            pat=SecretStr("token"),
+        )
+        factory = ConfluenceClientFactory({})
+
+        with patch("roundtripper.api_client.ConfluenceApiSdk", side_effect=ValueError("bad")):
+            with pytest.raises(ConnectionError, match="Confluence connection failed: bad"):
+                factory.create(auth, test_connection=False)
+
 
 class TestGetConfluenceClient:
     """Tests for get_confluence_client function."""
@@ -105,3 +219,90 @@ class TestGetConfluenceClient:
             result = get_confluence_client()
 
             assert result is mock_client
+
+    def test_reuses_cached_client(
+        self, mock_settings: MagicMock, mock_confluence_class: MagicMock
+    ) -> None:
+        """Test that repeated calls with the same settings reuse one client."""
+        mock_settings.connection_config.model_dump.return_value = {"retry_status_codes": [429]}
+
+        first = get_confluence_client()
+        second = get_confluence_client()
+
+        assert first is second
+        mock_confluence_class.assert_called_once()
+        mock_confluence_class.return_value.get_all_spaces.assert_called_once_with(limit=1)
+
+    @pytest.mark.parametrize(
+        ("first_tested", "second_tested", "expected_tests"),
+        [(False, True, 1), (False, False, 0), (True, False, 1), (True, True, 1)],
+    )
+    @pytest.mark.usefixtures("mock_settings")
+    def test_cached_client_tested_once_when_requested(
+        self,
+        first_tested: bool,
+        second_tested: bool,
+        expected_tests: int,
+        mock_confluence_class: MagicMock,
+    ) -> None:
+        """Test that a cached untested client is tested when a tested client is requested."""
+        first = get_confluence_client(test_connection=first_tested)
+        second = get_confluence_client(test_connection=second_tested)
+        get_confluence_client(test_connection=second_tested)
+
+        assert first is second
+        mock_confluence_class.assert_called_once()
+        get_all_spaces = mock_confluence_class.return_value.get_all_spaces
+        assert get_all_spaces.call_count == expected_tests
+
+    @pytest.mark.usefixtures("mock_settings")
+    def test_cached_client_connection_test_failure(self, mock_confluence_class: MagicMock) -> None:
+        """Test that a failing test of a cached client raises and is retried next time."""
+        get_all_spaces = mock_confluence_class.return_value.get_all_spaces
+        get_all_spaces.side_effect = [Exception("Unauthorized"), None]
+
+        get_confluence_client(test_connection=False)
+        with pytest.raises(ConnectionError, match="Unauthorized"):
+            get_confluence_client()
+        get_confluence_client()
+
+        assert get_all_spaces.call_count == 2
+
+    def test_new_client_after_settings_change(
+        self, mock_settings: MagicMock, mock_confluence_class: MagicMock
+    ) -> None:
+        """Test that changed credentials create a new client."""
+        get_confluence_client()
+        mock_settings.auth.confluence = ApiDetails(
+            url=AnyHttpUrl("https://example.com"),
+            pat=SecretStr("other-token"),
+        )
+        get_confluence_client()
+
+        assert mock_confluence_class.call_count == 2
+
+    @pytest.mark.usefixtures("mock_settings")
+    def test_clear_client_cache(self, mock_confluence_class: MagicMock) -> None:
+        """Test that clearing the cache forces a new client."""
+        get_confluence_client()
+        clear_client_cache()
+        get_confluence_client()
+
+        assert mock_confluence_class.call_count == 2
+
+    @pytest.mark.usefixtures("mock_confluence_class")
+    def test_cache_key_hides_secrets(self, mock_settings: MagicMock) -> None:
+        """Test that the client cache does not hold the credentials in plain text."""
+        mock_settings.auth.confluence = ApiDetails(
+            url=AnyHttpUrl("https://example.com"),
+            username=SecretStr("user@example.com"),
+            api_token=SecretStr("api-token-secret"),
+            pat=SecretStr("pat-secret"),
+        )
+
+        get_confluence_client()
+
+        cache_repr = repr(api_client._CLIENT_CACHE)
+        assert "https://example.com/" in cache_repr
+        for secret in ("user@example.com", "api-token-secret", "pat-secret"):
+            assert secret not in cache_repr
@@ -1,45 +1,222 @@
 """Test the CLI entry point."""
 
+import io
+import logging
+import runpy
+import sys
+import uuid
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
 from pathlib import Path
+from unittest.mock import MagicMock, Mock
 
 import pytest
+from pydantic import AnyHttpUrl, SecretStr
 from pytest_mock import MockerFixture
 from rich.console import Console
 
-import roundtripper.cli
+from roundtripper import confluence
 from roundtripper.cli import app, cli
-from roundtripper.config import ConfigModel
-from roundtripper.config_store import save_app_data
+from roundtripper.config import ApiDetails, AuthConfig, ConfigModel
+from roundtripper.diff_service import DiffService
+from roundtripper.models import DiffResult, PullResult, PushResult
+from roundtripper.pull_service import PullService
+from roundtripper.push_service import PushService
+
+#: Default settings, serialized as written to the config file.
+_DEFAULT_CONFIG_JSON = ConfigModel().model_dump_json(indent=2).encode()
+#: URL of the Confluence instance used in test settings.
+_URL = AnyHttpUrl("https://example.atlassian.net")
+#: Settings without a Confluence URL.
+_CONFIG_NO_URL = ConfigModel(auth=AuthConfig(confluence=ApiDetails(url="")))
+#: Settings with a Confluence URL but no credentials.
+_CONFIG_URL_ONLY = ConfigModel(auth=AuthConfig(confluence=ApiDetails(url=_URL)))
+#: Settings authenticating with a personal access token.
+_CONFIG_PAT = ConfigModel(
+    auth=AuthConfig(confluence=ApiDetails(url=_URL, pat=SecretStr("test-pat-token")))
+)
+#: Settings authenticating with username and API token.
+_CONFIG_BASIC_AUTH = ConfigModel(
+    auth=AuthConfig(
+        confluence=ApiDetails(
+            url=_URL,
+            username=SecretStr("user@example.com"),
+            api_token=SecretStr("bad-token"),
+        )
+    )
+)
+
+#: Rich console with consistent output, shared by all tests.
+_CONSOLE = Console(
+    width=70,
+    force_terminal=True,
+    highlight=False,
+    color_system=None,
+    legacy_windows=False,
+)
+
+#: Lower-case tokens expected in the help output of each command.
+_HELP_TOKENS: dict[str, tuple[str, ...]] = {
+    "roundtripper": (
+        "roundtripper",
+        "roundtripping with confluence",
+        "confluence-related commands",
+        "--help",
+        "--version",
+    ),
+    "confluence": ("confluence", "config"),
+    "config": ("config", "--show", "--jump-to"),
+    "ping": ("ping", "test confluence api connection"),
+    "pull": ("--space", "--page-id", "--output", "--dry-run"),
+    "push": ("message", "--page-path", "--space-path", "--recursive", "--dry-run", "--force"),
+}
+
+
+def _missing_help_tokens(output: str, command: str) -> list[str]:
+    """Return the tokens expected in the help of ``command`` that ``output`` lacks."""
+    lowered = output.lower()
+    return [token for token in _HELP_TOKENS[command] if token not in lowered]
+
+
+def _missing_log_messages(records: list[logging.LogRecord], expected: list[str]) -> list[str]:
+    """Return the expected texts that no message in ``records`` contains."""
+    messages = [record.getMessage() for record in records]
+    return [text for text in expected if not any(text in message for message in messages)]
+
+
+@pytest.fixture(scope="session")
+def console() -> Console:
+    """Fixture for consistent Rich console output in tests, shared across the session."""
+    return _CONSOLE
 
 
-@pytest.fixture
-def console() -> Console:
-    """Fixture for consistent Rich console output in tests."""
-    return Console(
-        width=70,
-        force_terminal=True,
-        highlight=False,
-        color_system=None,
-        legacy_windows=False,
-    )
+@pytest.fixture(scope="session")
+def config_base_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one temporary base directory for the config files of all tests."""
+    return tmp_path_factory.mktemp("config")
+
+
+@pytest.fixture(scope="session")
+def null_console() -> Console:
+    """Fixture for a Rich console that discards its output, for tests that only check exits."""
+    return Console(file=io.StringIO(), color_system=None, force_terminal=False, width=80)
+
+
+@pytest.fixture(scope="session")
+def shared_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create directories that commands only need to exist, shared by all tests.
+
+    Contains the ``page``, ``space``, and ``local`` directories; commands under test
+    run with mocked services, so nothing is written to them.
+    """
+    base_dir = tmp_path_factory.mktemp("shared")
+    for name in ("page", "space", "local"):
+        (base_dir / name).mkdir()
+    return base_dir
+
+
+@pytest.fixture(scope="session")
+def page_path(shared_dir: Path) -> Path:
+    """Return the shared existing page directory."""
+    return shared_dir / "page"
+
+
+@pytest.fixture(scope="session")
+def local_path(shared_dir: Path) -> Path:
+    """Return the shared existing local directory to diff against."""
+    return shared_dir / "local"
 
 
 @pytest.fixture
-def temp_config_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
-    """Create a temporary config file for testing."""
-    config_file = tmp_path / "roundtripper" / "config.json"
-    config_file.parent.mkdir(parents=True, exist_ok=True)
+def patched_config_path(config_base_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the config file path at a fresh temporary location without creating anything."""
+    config_file = config_base_dir / uuid.uuid4().hex / "config.json"
     monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", config_file)
     return config_file
 
 
+@pytest.fixture(scope="session")
+def default_config_file(config_base_dir: Path) -> Path:
+    """Write the default settings to a config file once per session.
+
+    Tests must only read this file; tests that change the config use
+    ``patched_config_path`` instead.
+    """
+    config_file = config_base_dir / "default" / "config.json"
+    config_file.parent.mkdir()
+    config_file.write_bytes(_DEFAULT_CONFIG_JSON)
+    return config_file
+
+
+@pytest.fixture
+def temp_config_file(default_config_file: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the config file path at the shared default config file."""
+    monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", default_config_file)
+    return default_config_file
+
+
+@pytest.fixture
+def info_logs(caplog: pytest.LogCaptureFixture) -> None:
+    """Capture log records from INFO level up."""
+    caplog.set_level(logging.INFO)
+
+
+@pytest.fixture
+def mock_get_client(mocker: MockerFixture) -> MagicMock:
+    """Patch the Confluence client factory used by the commands and return the patch.
+
+    The patched factory returns a mock client by default; tests simulate connection
+    failures by setting its ``side_effect``.
+    """
+    return mocker.patch.object(confluence, "get_confluence_client", return_value=mocker.Mock())
+
+
+@dataclass(frozen=True)
+class ConfluenceMocks:
+    """Mocks installed by the ``mocked_confluence`` fixture."""
+
+    #: Client returned by the patched client factory.
+    client: Mock
+    #: Patched ``PushService`` class, for checking how the service is created.
+    push_factory: MagicMock
+    #: Pull service instance created by the pull command.
+    pull: Mock
+    #: Push service instance created by the push command.
+    push: Mock
+    #: Diff service instance created by the diff command.
+    diff: Mock
+
+
+@pytest.fixture
+def mocked_confluence(mocker: MockerFixture, mock_get_client: MagicMock) -> ConfluenceMocks:
+    """Patch the client factory and the services used by the commands.
+
+    Tests set the results of the returned service instances.
+    """
+    pull = mocker.Mock(spec=PullService)
+    push = mocker.Mock(spec=PushService)
+    diff = mocker.Mock(spec=DiffService)
+    mocker.patch.object(confluence, "PullService", return_value=pull)
+    push_factory = mocker.patch.object(confluence, "PushService", return_value=push)
+    mocker.patch.object(confluence, "DiffService", return_value=diff)
+    return ConfluenceMocks(
+        client=mock_get_client.return_value,
+        push_factory=push_factory,
+        pull=pull,
+        push=push,
+        diff=diff,
+    )
+
+
 class TestCLIBehavior:
     """Test CLI behavior including argument parsing and output."""
 
-    def test_no_command_shows_help(self, capsys: pytest.CaptureFixture[str]) -> None:
+    def test_no_command_shows_help(
+        self, capsys: pytest.CaptureFixture[str], console: Console
+    ) -> None:
         """Test that running with no command shows help."""
         with pytest.raises(SystemExit) as exc_info:
-            app([])
+            app([], console=console)
 
         # Should exit with code 0 (help page)
         assert exc_info.value.code == 0
@@ -57,17 +234,36 @@ class TestCLIBehavior:
         # Help pages exit with code 0
         assert exc_info.value.code == 0
 
-        actual = capsys.readouterr().out
         # Check for key elements in the help output
-        assert "roundtripper" in actual
-        assert "Roundtripping with Confluence" in actual
-        assert "--help" in actual
-        assert "--version" in actual
+        assert _missing_help_tokens(capsys.readouterr().out, "roundtripper") == []
+
+    @pytest.mark.parametrize(
+        ("tokens", "command"),
+        [
+            (["confluence"], "confluence"),
+            (["confluence", "config"], "config"),
+            (["confluence", "ping"], "ping"),
+            (["confluence", "pull"], "pull"),
+            (["confluence", "push"], "push"),
+        ],
+        ids=["confluence", "config", "ping", "pull", "push"],
+    )
+    def test_command_help(
+        self,
+        capsys: pytest.CaptureFixture[str],
+        console: Console,
+        tokens: list[str],
+        command: str,
+    ) -> None:
+        """Test that each command's help shows its options."""
+        app.help_print(tokens, console=console)
+
+        assert _missing_help_tokens(capsys.readouterr().out, command) == []
 
-    def test_version_flag(self, capsys: pytest.CaptureFixture[str]) -> None:
+    def test_version_flag(self, capsys: pytest.CaptureFixture[str], console: Console) -> None:
         """Test that --version displays the version and exits."""
         with pytest.raises(SystemExit) as exc_info:
-            app(["--version"])
+            app(["--version"], console=console)
 
         # Version flag exits with code 0
         assert exc_info.value.code == 0
@@ -81,29 +277,23 @@ class TestCLIBehavior:
         assert app is not None
         assert "roundtripper" in app.name
 
-    def test_cli_entry_point(self, mocker: MockerFixture) -> None:
+    def test_cli_entry_point(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test the cli() entry point function."""
-        # Mock sys.argv to provide help arguments
-        mocker.patch("sys.argv", ["roundtripper", "--help"])
+        # Provide help arguments
+        monkeypatch.setattr(sys, "argv", ["roundtripper", "--help"])
 
-        # Suppress the pytest warning since we're deliberately testing the CLI entry point
-        import warnings
-
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=UserWarning, message=".*Cyclopts.*")
-
-            # Call cli() which should call app.meta([]) and show help
-            with pytest.raises(SystemExit) as exc_info:
-                cli()
+        # Call cli() which should call app.meta([]) and show help
+        with pytest.raises(SystemExit) as exc_info:
+            cli()
 
         # Should exit with code 0 for help
         assert exc_info.value.code == 0
 
-    def test_verbose_mode(self, capsys: pytest.CaptureFixture[str]) -> None:
+    def test_verbose_mode(self, capsys: pytest.CaptureFixture[str], console: Console) -> None:
         """Test that --verbose flag enables debug logging."""
         # This should trigger the meta.default function with verbose=True
         with pytest.raises(SystemExit) as exc_info:
-            app(["--verbose", "--help"])
+            app(["--verbose", "--help"], console=console)
 
         assert exc_info.value.code == 0
         # The help output should still be shown
@@ -118,10 +308,6 @@ class TestConfluenceConfigCommand:
         self, capsys: pytest.CaptureFixture[str], temp_config_file: Path
     ) -> None:
         """Test that --show flag displays current config."""
-        # Create a config with known values
-        config = ConfigModel()
-        save_app_data(config)
-
         # Run the command with --show flag
         app(["confluence", "config", "--show"], result_action="return_value")
 
@@ -131,10 +317,12 @@ class TestConfluenceConfigCommand:
         assert "auth" in captured.out
         assert "confluence" in captured.out
 
-    def test_config_interactive_menu(self, mocker: MockerFixture, temp_config_file: Path) -> None:
+    def test_config_interactive_menu(
+        self, mocker: MockerFixture, patched_config_path: Path
+    ) -> None:
         """Test that config without --show opens interactive menu."""
         # Mock the interactive menu function at the top level where it's imported
-        mock_menu = mocker.patch("roundtripper.confluence.main_config_menu_loop")
+        mock_menu = mocker.patch.object(confluence, "main_config_menu_loop")
 
         # Run the command without --show flag
         app(["confluence", "config"], result_action="return_value")
@@ -142,10 +330,12 @@ class TestConfluenceConfigCommand:
         # Verify the interactive menu was called
         mock_menu.assert_called_once_with(None)
 
-    def test_config_jump_to_parameter(self, mocker: MockerFixture, temp_config_file: Path) -> None:
+    def test_config_jump_to_parameter(
+        self, mocker: MockerFixture, patched_config_path: Path
+    ) -> None:
         """Test that --jump-to parameter is passed to interactive menu."""
         # Mock the interactive menu function at the top level where it's imported
-        mock_menu = mocker.patch("roundtripper.confluence.main_config_menu_loop")
+        mock_menu = mocker.patch.object(confluence, "main_config_menu_loop")
 
         # Run the command with --jump-to
         app(
@@ -156,366 +346,194 @@ class TestConfluenceConfigCommand:
         # Verify the interactive menu was called with the right parameter
         mock_menu.assert_called_once_with("auth.confluence")
 
-    def test_confluence_help(self, capsys: pytest.CaptureFixture[str], console: Console) -> None:
-        """Test that confluence --help shows subcommands."""
-        with pytest.raises(SystemExit) as exc_info:
-            app(["confluence", "--help"], console=console)
-
-        assert exc_info.value.code == 0
-
-        captured = capsys.readouterr()
-        assert "confluence" in captured.out.lower()
-        assert "config" in captured.out.lower()
-
-    def test_config_help(self, capsys: pytest.CaptureFixture[str], console: Console) -> None:
-        """Test that confluence config --help shows options."""
-        with pytest.raises(SystemExit) as exc_info:
-            app(["confluence", "config", "--help"], console=console)
-
-        assert exc_info.value.code == 0
-
-        captured = capsys.readouterr()
-        assert "config" in captured.out.lower()
-        assert "--show" in captured.out.lower()
-        assert "--jump-to" in captured.out.lower()
-
-    def test_ping_help(self, capsys: pytest.CaptureFixture[str], console: Console) -> None:
-        """Test that confluence ping --help shows help."""
-        with pytest.raises(SystemExit) as exc_info:
-            app(["confluence", "ping", "--help"], console=console)
-
-        assert exc_info.value.code == 0
-
-        captured = capsys.readouterr()
-        assert "ping" in captured.out.lower()
-        assert "test confluence api connection" in captured.out.lower()
-
-    def test_ping_no_config(self, mocker: MockerFixture, temp_config_file: Path) -> None:
+    def test_ping_no_config(
+        self, monkeypatch: pytest.MonkeyPatch, patched_config_path: Path
+    ) -> None:
         """Test ping command with no configuration."""
-        # Mock get_settings to return empty config
-        from roundtripper.config import ApiDetails, AuthConfig, ConfigModel
-
-        empty_config = ConfigModel(auth=AuthConfig(confluence=ApiDetails(url="")))
-        mocker.patch("roundtripper.confluence.get_settings", return_value=empty_config)
+        # Return settings without a URL
+        monkeypatch.setattr(confluence, "get_settings", lambda: _CONFIG_NO_URL)
 
         with pytest.raises(SystemExit) as exc_info:
             app(["confluence", "ping"], result_action="return_value")
 
         assert exc_info.value.code == 1
 
-    def test_ping_success(self, mocker: MockerFixture, temp_config_file: Path) -> None:
+    def test_ping_success(
+        self, monkeypatch: pytest.MonkeyPatch, patched_config_path: Path, mock_get_client: MagicMock
+    ) -> None:
         """Test ping command with successful connection."""
-        from roundtripper.config import ConfigModel
-
-        # Mock config with PAT
-        test_config = ConfigModel.model_validate(
-            {
-                "auth": {
-                    "confluence": {
-                        "url": "https://example.atlassian.net",
-                        "pat": "test-pat-token",
-                    }
-                }
-            }
-        )
-        mocker.patch("roundtripper.confluence.get_settings", return_value=test_config)
-
-        # Mock get_confluence_client to return a mock client
-        mock_client = mocker.Mock()
-        mock_client.get_all_spaces.return_value = {"results": [], "size": 1}
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
+        # Return settings with a PAT
+        monkeypatch.setattr(confluence, "get_settings", lambda: _CONFIG_PAT)
 
         app(["confluence", "ping"], result_action="return_value")
 
-        # Should not raise SystemExit on success
-        mock_client.get_all_spaces.assert_called_once_with(limit=1)
-
-    def test_ping_connection_failure(self, mocker: MockerFixture, temp_config_file: Path) -> None:
-        """Test ping command with connection failure."""
-        from roundtripper.config import ConfigModel
-
-        test_config = ConfigModel.model_validate(
-            {
-                "auth": {
-                    "confluence": {
-                        "url": "https://example.atlassian.net",
-                        "username": "user@example.com",
-                        "api_token": "bad-token",
-                    }
-                }
-            }
-        )
-        mocker.patch("roundtripper.confluence.get_settings", return_value=test_config)
+        # Should not raise SystemExit on success; the space list is fetched exactly once
+        mock_get_client.assert_called_once_with(test_connection=False)
+        mock_get_client.return_value.get_all_spaces.assert_called_once_with(limit=1)
 
-        # Mock get_confluence_client to raise ConnectionError
-        mocker.patch(
-            "roundtripper.confluence.get_confluence_client",
-            side_effect=ConnectionError("Authentication failed"),
-        )
+    def test_ping_request_failure(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        patched_config_path: Path,
+        mock_get_client: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that a failing space list request is reported as a connection failure."""
+        monkeypatch.setattr(confluence, "get_settings", lambda: _CONFIG_PAT)
+        mock_get_client.return_value.get_all_spaces.side_effect = RuntimeError("401 Unauthorized")
 
-        with pytest.raises(SystemExit) as exc_info:
+        with pytest.raises(SystemExit, match="^1$"):
             app(["confluence", "ping"], result_action="return_value")
 
-        assert exc_info.value.code == 1
-
-    def test_ping_no_credentials(self, mocker: MockerFixture, temp_config_file: Path) -> None:
-        """Test ping command with URL but no credentials."""
-        from roundtripper.config import ConfigModel
+        expected = ["✗ Connection failed: 401 Unauthorized"]
+        assert _missing_log_messages(caplog.records, expected) == []
 
-        test_config = ConfigModel.model_validate(
-            {"auth": {"confluence": {"url": "https://example.atlassian.net"}}}
-        )
-        mocker.patch("roundtripper.confluence.get_settings", return_value=test_config)
+    @pytest.mark.parametrize(
+        ("config", "error"),
+        [
+            (_CONFIG_BASIC_AUTH, ConnectionError("Authentication failed")),
+            (_CONFIG_PAT, RuntimeError("Unexpected error")),
+        ],
+        ids=["connection-error", "generic-exception"],
+    )
+    def test_ping_client_failure(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        patched_config_path: Path,
+        mock_get_client: MagicMock,
+        config: ConfigModel,
+        error: Exception,
+    ) -> None:
+        """Test ping command when creating the client fails."""
+        monkeypatch.setattr(confluence, "get_settings", lambda: config)
+        mock_get_client.side_effect = error
 
         with pytest.raises(SystemExit) as exc_info:
             app(["confluence", "ping"], result_action="return_value")
 
         assert exc_info.value.code == 1
 
-    def test_ping_generic_exception(self, mocker: MockerFixture, temp_config_file: Path) -> None:
-        """Test ping command with generic exception."""
-        from roundtripper.config import ConfigModel
-
-        test_config = ConfigModel.model_validate(
-            {
-                "auth": {
-                    "confluence": {
-                        "url": "https://example.atlassian.net",
-                        "pat": "test-pat",
-                    }
-                }
-            }
-        )
-        mocker.patch("roundtripper.confluence.get_settings", return_value=test_config)
-
-        # Mock get_confluence_client to raise a generic exception
-        mocker.patch(
-            "roundtripper.confluence.get_confluence_client",
-            side_effect=RuntimeError("Unexpected error"),
-        )
+    def test_ping_no_credentials(
+        self, monkeypatch: pytest.MonkeyPatch, patched_config_path: Path
+    ) -> None:
+        """Test ping command with URL but no credentials."""
+        monkeypatch.setattr(confluence, "get_settings", lambda: _CONFIG_URL_ONLY)
 
         with pytest.raises(SystemExit) as exc_info:
             app(["confluence", "ping"], result_action="return_value")
 
         assert exc_info.value.code == 1
 
-    def test_main_module_execution(self, mocker: MockerFixture) -> None:
+    def test_main_module_execution(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test __main__ execution path."""
-        # Mock sys.argv to provide help arguments
-        mocker.patch("sys.argv", ["roundtripper", "--help"])
-
-        # Mock the cli function to verify it gets called
-        _mock_cli = mocker.patch("roundtripper.cli.cli")
+        # Provide help arguments
+        monkeypatch.setattr(sys, "argv", ["roundtripper", "--help"])
 
-        # Execute the module's __main__ code directly
-        if roundtripper.cli.__name__ != "__main__":
-            # Simulate the __main__ block
-            with pytest.raises(SystemExit) as exc_info:
-                exec(
-                    compile(
-                        open(roundtripper.cli.__file__).read(), roundtripper.cli.__file__, "exec"
-                    ),
-                    {"__name__": "__main__", "__file__": roundtripper.cli.__file__},
-                )
+        # Run the module as __main__ from its cached bytecode; runpy warns because the
+        # module is already imported
+        with pytest.warns(RuntimeWarning), pytest.raises(SystemExit) as exc_info:
+            runpy.run_module("roundtripper.cli", run_name="__main__")
 
-            # Should exit with code 0
-            assert exc_info.value.code == 0
+        # Should exit with code 0
+        assert exc_info.value.code == 0
 
 
+@pytest.mark.usefixtures("info_logs")
 class TestConfluencePullCommand:
     """Tests for the confluence pull command."""
 
-    def test_pull_help(self, capsys: pytest.CaptureFixture[str]) -> None:
-        """Test pull command help shows required options."""
-        app(["confluence", "pull", "--help"], result_action="return_value")
-
-        captured = capsys.readouterr()
-        assert "--space" in captured.out
-        assert "--page-id" in captured.out
-        assert "--output" in captured.out
-        assert "--dry-run" in captured.out
-
-    def test_pull_no_space_or_page_id(self, mocker: MockerFixture) -> None:
-        """Test pull command fails without --space or --page-id."""
-        with pytest.raises(SystemExit) as exc_info:
-            app(["confluence", "pull"], result_action="return_value")
-
-        assert exc_info.value.code == 1
-
-    def test_pull_both_space_and_page_id(self, mocker: MockerFixture) -> None:
-        """Test pull command fails with both --space and --page-id."""
-        with pytest.raises(SystemExit) as exc_info:
-            app(
-                ["confluence", "pull", "--space", "SPACE", "--page-id", "123"],
-                result_action="return_value",
-            )
-
-        assert exc_info.value.code == 1
-
-    def test_pull_connection_error(self, mocker: MockerFixture, temp_config_file: Path) -> None:
-        """Test pull command handles connection error."""
-        mocker.patch(
-            "roundtripper.confluence.get_confluence_client",
-            side_effect=ConnectionError("Failed to connect"),
-        )
-
-        with pytest.raises(SystemExit) as exc_info:
-            app(["confluence", "pull", "--space", "SPACE"], result_action="return_value")
-
-        assert exc_info.value.code == 1
-
-    def test_pull_space_success(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
-    ) -> None:
-        """Test pull command succeeds with --space."""
-        from roundtripper.models import PullResult
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.pull_space.return_value = PullResult(
-            pages_downloaded=5, attachments_downloaded=3
-        )
-        mocker.patch("roundtripper.confluence.PullService", return_value=mock_service_instance)
-
-        app(
-            ["confluence", "pull", "--space", "SPACE", "--output", str(tmp_path)],
-            result_action="return_value",
-        )
-
-        mock_service_instance.pull_space.assert_called_once_with("SPACE")
-
-    def test_pull_page_success(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
-    ) -> None:
-        """Test pull command succeeds with --page-id."""
-        from roundtripper.models import PullResult
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.pull_page.return_value = PullResult(
-            pages_downloaded=1, attachments_downloaded=0
-        )
-        mocker.patch("roundtripper.confluence.PullService", return_value=mock_service_instance)
-
-        app(
-            ["confluence", "pull", "--page-id", "12345", "--output", str(tmp_path)],
-            result_action="return_value",
-        )
-
-        # Default is recursive=True
-        mock_service_instance.pull_page.assert_called_once_with(12345, recursive=True)
-
-    def test_pull_page_recursive(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
-    ) -> None:
-        """Test pull command with --no-recursive flag."""
-        from roundtripper.models import PullResult
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.pull_page.return_value = PullResult(
-            pages_downloaded=5, attachments_downloaded=0
-        )
-        mocker.patch("roundtripper.confluence.PullService", return_value=mock_service_instance)
-
-        app(
-            [
-                "confluence",
-                "pull",
-                "--page-id",
-                "12345",
-                "--no-recursive",
-                "--output",
-                str(tmp_path),
-            ],
-            result_action="return_value",
-        )
-
-        mock_service_instance.pull_page.assert_called_once_with(12345, recursive=False)
-
-    def test_pull_with_errors(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
+    @pytest.mark.parametrize(
+        ("args", "method", "call_args", "call_kwargs", "errors", "expectation"),
+        [
+            (["--space", "SPACE"], "pull_space", ("SPACE",), {}, [], nullcontext()),
+            # Pages are pulled recursively by default
+            (["--page-id", "12345"], "pull_page", (12345,), {"recursive": True}, [], nullcontext()),
+            (
+                ["--page-id", "12345", "--no-recursive"],
+                "pull_page",
+                (12345,),
+                {"recursive": False},
+                [],
+                nullcontext(),
+            ),
+            (
+                ["--space", "SPACE"],
+                "pull_space",
+                ("SPACE",),
+                {},
+                ["Error 1", "Error 2"],
+                pytest.raises(SystemExit, match="^1$"),
+            ),
+        ],
+        ids=["space", "page", "page-no-recursive", "errors"],
+    )
+    def test_pull(
+        self,
+        patched_config_path: Path,
+        mocked_confluence: ConfluenceMocks,
+        shared_dir: Path,
+        args: list[str],
+        method: str,
+        call_args: tuple[object, ...],
+        call_kwargs: dict[str, object],
+        errors: list[str],
+        expectation: AbstractContextManager[object],
     ) -> None:
-        """Test pull command exits with error when result has errors."""
-        from roundtripper.models import PullResult
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.api_client.get_confluence_client", return_value=mock_client)
+        """Test pull command calls the service and fails when the result has errors."""
+        pull_method = getattr(mocked_confluence.pull, method)
+        pull_method.return_value = PullResult(pages_downloaded=5, errors=errors)
 
-        mock_service = mocker.MagicMock()
-        mock_service.pull_space.return_value = PullResult(
-            pages_downloaded=5, errors=["Error 1", "Error 2"]
-        )
-        mocker.patch("roundtripper.pull_service.PullService", return_value=mock_service)
-
-        with pytest.raises(SystemExit) as exc_info:
+        with expectation:
             app(
-                ["confluence", "pull", "--space", "SPACE", "--output", str(tmp_path)],
+                ["confluence", "pull", *args, "--output", str(shared_dir)],
                 result_action="return_value",
             )
 
-        assert exc_info.value.code == 1
+        pull_method.assert_called_once_with(*call_args, **call_kwargs)
 
     def test_pull_with_more_than_five_errors(
         self,
-        mocker: MockerFixture,
-        temp_config_file: Path,
-        tmp_path: Path,
+        patched_config_path: Path,
+        mocked_confluence: ConfluenceMocks,
+        shared_dir: Path,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         """Test pull command truncates error output when more than 5 errors."""
-        from roundtripper.models import PullResult
 
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
         # Create 7 errors to trigger the truncation message
-        mock_service_instance.pull_space.return_value = PullResult(
+        mocked_confluence.pull.pull_space.return_value = PullResult(
             pages_downloaded=0,
             errors=[f"Error {i}" for i in range(7)],
         )
-        mocker.patch("roundtripper.confluence.PullService", return_value=mock_service_instance)
 
         with pytest.raises(SystemExit) as exc_info:
             app(
-                ["confluence", "pull", "--space", "SPACE", "--output", str(tmp_path)],
+                ["confluence", "pull", "--space", "SPACE", "--output", str(shared_dir)],
                 result_action="return_value",
             )
 
         assert exc_info.value.code == 1
         # Check log messages - should show first 5 errors and a "more errors" message
-        assert "Error 0" in caplog.text
-        assert "2 more errors" in caplog.text
+        assert _missing_log_messages(caplog.records, ["Error 0", "2 more errors"]) == []
+        # The whole summary is logged as a single record
+        summaries = [r for r in caplog.records if "Errors encountered" in r.getMessage()]
+        assert len(summaries) == 1
+        assert "Error 4" in summaries[0].getMessage()
+        assert "Error 5" not in summaries[0].getMessage()
 
     def test_pull_dry_run(
         self,
-        mocker: MockerFixture,
-        temp_config_file: Path,
-        tmp_path: Path,
+        patched_config_path: Path,
+        mocked_confluence: ConfluenceMocks,
+        mock_get_client: MagicMock,
+        shared_dir: Path,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         """Test pull command with --dry-run flag."""
-        import logging
-
-        from roundtripper.models import PullResult
-
-        caplog.set_level(logging.INFO)
 
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.pull_space.return_value = PullResult(
+        mocked_confluence.pull.pull_space.return_value = PullResult(
             pages_downloaded=5, attachments_downloaded=3
         )
-        mocker.patch("roundtripper.confluence.PullService", return_value=mock_service_instance)
 
         app(
             [
@@ -525,33 +543,29 @@ class TestConfluencePullCommand:
                 "SPACE",
                 "--dry-run",
                 "--output",
-                str(tmp_path),
+                str(shared_dir),
             ],
             result_action="return_value",
         )
 
         # Verify dry_run output is shown in logs
-        assert "DRY RUN" in caplog.text
+        assert _missing_log_messages(caplog.records, ["DRY RUN"]) == []
+        # Dry runs skip the connection test
+        mock_get_client.assert_called_once_with(test_connection=False)
 
     def test_pull_verbose_flag(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
+        self,
+        patched_config_path: Path,
+        mocked_confluence: ConfluenceMocks,
+        shared_dir: Path,
     ) -> None:
         """Test pull command with --verbose flag enables debug logging."""
-        import logging
-
-        from roundtripper.models import PullResult
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.pull_space.return_value = PullResult(
+        mocked_confluence.pull.pull_space.return_value = PullResult(
             pages_downloaded=1, attachments_downloaded=0
         )
-        mocker.patch("roundtripper.confluence.PullService", return_value=mock_service_instance)
 
         app(
-            ["confluence", "pull", "--space", "SPACE", "--output", str(tmp_path), "--verbose"],
+            ["confluence", "pull", "--space", "SPACE", "--output", str(shared_dir), "--verbose"],
             result_action="return_value",
         )
 
@@ -559,314 +573,85 @@ class TestConfluencePullCommand:
         assert logging.getLogger("roundtripper").level == logging.DEBUG
 
 
+@pytest.mark.usefixtures("info_logs")
 class TestConfluencePushCommand:
     """Tests for the confluence push command."""
 
-    def test_push_help(self, capsys: pytest.CaptureFixture[str]) -> None:
-        """Test push command help shows required options."""
-        app(["confluence", "push", "--help"], result_action="return_value")
-
-        captured = capsys.readouterr()
-        assert "message" in captured.out.lower()
-        assert "--page-path" in captured.out
-        assert "--space-path" in captured.out
-        assert "--recursive" in captured.out
-        assert "--dry-run" in captured.out
-        assert "--force" in captured.out
-
-    def test_push_no_path_specified(self, mocker: MockerFixture) -> None:
-        """Test push command fails without --page-path or --space-path."""
-        with pytest.raises(SystemExit) as exc_info:
-            app(["confluence", "push", "Test message"], result_action="return_value")
-
-        assert exc_info.value.code == 1
-
-    def test_push_both_paths_specified(self, mocker: MockerFixture, tmp_path: Path) -> None:
-        """Test push command fails with both --page-path and --space-path."""
-        page_path = tmp_path / "page"
-        page_path.mkdir()
-        space_path = tmp_path / "space"
-        space_path.mkdir()
-
-        with pytest.raises(SystemExit) as exc_info:
-            app(
-                [
-                    "confluence",
-                    "push",
-                    "Test message",
-                    "--page-path",
-                    str(page_path),
-                    "--space-path",
-                    str(space_path),
-                ],
-                result_action="return_value",
-            )
-
-        assert exc_info.value.code == 1
-
-    def test_push_nonexistent_path(self, mocker: MockerFixture, tmp_path: Path) -> None:
-        """Test push command fails with nonexistent path."""
-        with pytest.raises(SystemExit) as exc_info:
-            app(
-                [
-                    "confluence",
-                    "push",
-                    "Test message",
-                    "--page-path",
-                    str(tmp_path / "nonexistent"),
-                ],
-                result_action="return_value",
-            )
-
-        assert exc_info.value.code == 1
-
-    def test_push_connection_error(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
-    ) -> None:
-        """Test push command handles connection error."""
-        page_path = tmp_path / "page"
-        page_path.mkdir()
-
-        mocker.patch(
-            "roundtripper.confluence.get_confluence_client",
-            side_effect=ConnectionError("Failed to connect"),
-        )
-
-        with pytest.raises(SystemExit) as exc_info:
-            app(
-                ["confluence", "push", "Test message", "--page-path", str(page_path)],
-                result_action="return_value",
-            )
-
-        assert exc_info.value.code == 1
-
-    def test_push_page_success(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
-    ) -> None:
-        """Test push command succeeds with --page-path."""
-        from roundtripper.models import PushResult
-
-        page_path = tmp_path / "page"
-        page_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.push_page.return_value = PushResult(pages_updated=1, pages_skipped=0)
-        mocker.patch("roundtripper.confluence.PushService", return_value=mock_service_instance)
-
-        app(
-            [
-                "confluence",
-                "push",
-                "Update page",
-                "--page-path",
-                str(page_path),
-                "--no-interactive",
-            ],
-            result_action="return_value",
-        )
-
-        mock_service_instance.push_page.assert_called_once_with(page_path, recursive=False)
-
-    def test_push_page_recursive(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
-    ) -> None:
-        """Test push command with --recursive flag."""
-        from roundtripper.models import PushResult
-
-        page_path = tmp_path / "page"
-        page_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.push_page.return_value = PushResult(pages_updated=3, pages_skipped=1)
-        mocker.patch("roundtripper.confluence.PushService", return_value=mock_service_instance)
-
-        app(
-            [
-                "confluence",
-                "push",
-                "Recursive update",
-                "--page-path",
-                str(page_path),
-                "--recursive",
-                "--no-interactive",
-            ],
-            result_action="return_value",
-        )
-
-        mock_service_instance.push_page.assert_called_once_with(page_path, recursive=True)
-
-    def test_push_space_success(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
+    @pytest.mark.parametrize(
+        ("args", "method", "call_args", "call_kwargs"),
+        [
+            (["--page-path", "page"], "push_page", (Path("page"),), {"recursive": False}),
+            (
+                ["--page-path", "page", "--recursive"],
+                "push_page",
+                (Path("page"),),
+                {"recursive": True},
+            ),
+            (["--space-path", "space"], "push_space", (Path("space"),), {}),
+        ],
+        ids=["page", "page-recursive", "space"],
+    )
+    def test_push(
+        self,
+        patched_config_path: Path,
+        mocked_confluence: ConfluenceMocks,
+        shared_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        args: list[str],
+        method: str,
+        call_args: tuple[Path, ...],
+        call_kwargs: dict[str, object],
     ) -> None:
-        """Test push command succeeds with --space-path."""
-        from roundtripper.models import PushResult
-
-        space_path = tmp_path / "SPACE"
-        space_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.push_space.return_value = PushResult(pages_updated=5, pages_skipped=2)
-        mocker.patch("roundtripper.confluence.PushService", return_value=mock_service_instance)
+        """Test push command calls the service for the given page or space path."""
+        monkeypatch.chdir(shared_dir)
+        push_method = getattr(mocked_confluence.push, method)
+        push_method.return_value = PushResult(pages_updated=3, pages_skipped=1)
 
         app(
-            ["confluence", "push", "Update space", "--space-path", str(space_path)],
+            ["confluence", "push", "Update", *args, "--no-interactive"],
             result_action="return_value",
         )
 
-        mock_service_instance.push_space.assert_called_once_with(space_path)
-
-    def test_push_with_conflicts(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
-    ) -> None:
-        """Test push command exits with error when conflicts exist."""
-        from roundtripper.models import PushResult
-
-        page_path = tmp_path / "page"
-        page_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.push_page.return_value = PushResult(
-            pages_updated=0,
-            conflicts=["Conflict: Page 1 - local version 1, server version 3"],
-        )
-        mocker.patch("roundtripper.confluence.PushService", return_value=mock_service_instance)
-
-        with pytest.raises(SystemExit) as exc_info:
-            app(
-                [
-                    "confluence",
-                    "push",
-                    "Conflict test",
-                    "--page-path",
-                    str(page_path),
-                    "--no-interactive",
-                ],
-                result_action="return_value",
-            )
-
-        assert exc_info.value.code == 1
-
-    def test_push_with_more_than_five_conflicts(
-        self,
-        mocker: MockerFixture,
-        temp_config_file: Path,
-        tmp_path: Path,
-        caplog: pytest.LogCaptureFixture,
-    ) -> None:
-        """Test push command truncates conflict output when more than 5 conflicts."""
-        from roundtripper.models import PushResult
-
-        page_path = tmp_path / "page"
-        page_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        # Create 7 conflicts to trigger the truncation message
-        mock_service_instance.push_page.return_value = PushResult(
-            pages_updated=0,
-            conflicts=[f"Conflict {i}" for i in range(7)],
-        )
-        mocker.patch("roundtripper.confluence.PushService", return_value=mock_service_instance)
-
-        with pytest.raises(SystemExit) as exc_info:
-            app(
-                [
-                    "confluence",
-                    "push",
-                    "Many conflicts",
-                    "--page-path",
-                    str(page_path),
-                    "--no-interactive",
-                ],
-                result_action="return_value",
-            )
-
-        assert exc_info.value.code == 1
-        # Check log messages - should show first 5 conflicts and a "more conflicts" message
-        assert "Conflict 0" in caplog.text
-        assert "2 more conflicts" in caplog.text
-
-    def test_push_with_more_than_five_errors(
+        push_method.assert_called_once_with(*call_args, **call_kwargs)
+
+    @pytest.mark.parametrize(
+        ("result", "expected_logs"),
+        [
+            (
+                PushResult(conflicts=["Conflict: Page 1 - local version 1, server version 3"]),
+                ["Conflict: Page 1"],
+            ),
+            # More than 5 conflicts or errors are truncated
+            (
+                PushResult(conflicts=[f"Conflict {i}" for i in range(7)]),
+                ["Conflict 0", "2 more conflicts"],
+            ),
+            (
+                PushResult(pages_updated=1, errors=["API Error: Permission denied"]),
+                ["API Error: Permission denied"],
+            ),
+            (PushResult(errors=[f"Error {i}" for i in range(7)]), ["Error 0", "2 more errors"]),
+        ],
+        ids=["conflict", "many-conflicts", "error", "many-errors"],
+    )
+    def test_push_failures(
         self,
-        mocker: MockerFixture,
-        temp_config_file: Path,
-        tmp_path: Path,
+        patched_config_path: Path,
+        mocked_confluence: ConfluenceMocks,
+        page_path: Path,
         caplog: pytest.LogCaptureFixture,
+        result: PushResult,
+        expected_logs: list[str],
     ) -> None:
-        """Test push command truncates error output when more than 5 errors."""
-        from roundtripper.models import PushResult
-
-        page_path = tmp_path / "page"
-        page_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        # Create 7 errors to trigger the truncation message
-        mock_service_instance.push_page.return_value = PushResult(
-            pages_updated=0,
-            errors=[f"Error {i}" for i in range(7)],
-        )
-        mocker.patch("roundtripper.confluence.PushService", return_value=mock_service_instance)
+        """Test push command logs conflicts and errors and exits with code 1."""
+        mocked_confluence.push.push_page.return_value = result
 
         with pytest.raises(SystemExit) as exc_info:
             app(
                 [
                     "confluence",
                     "push",
-                    "Many errors",
-                    "--page-path",
-                    str(page_path),
-                    "--no-interactive",
-                ],
-                result_action="return_value",
-            )
-
-        assert exc_info.value.code == 1
-        # Check log messages - should show first 5 errors and a "more errors" message
-        assert "Error 0" in caplog.text
-        assert "2 more errors" in caplog.text
-
-    def test_push_with_errors(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
-    ) -> None:
-        """Test push command exits with error when errors occur."""
-        from roundtripper.models import PushResult
-
-        page_path = tmp_path / "page"
-        page_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.push_page.return_value = PushResult(
-            pages_updated=1,
-            errors=["API Error: Permission denied"],
-        )
-        mocker.patch("roundtripper.confluence.PushService", return_value=mock_service_instance)
-
-        with pytest.raises(SystemExit) as exc_info:
-            app(
-                [
-                    "confluence",
-                    "push",
-                    "Error test",
+                    "Failing push",
                     "--page-path",
                     str(page_path),
                     "--no-interactive",
@@ -875,30 +660,18 @@ class TestConfluencePushCommand:
             )
 
         assert exc_info.value.code == 1
+        assert _missing_log_messages(caplog.records, expected_logs) == []
 
     def test_push_dry_run(
         self,
-        mocker: MockerFixture,
-        temp_config_file: Path,
-        tmp_path: Path,
+        patched_config_path: Path,
+        mocked_confluence: ConfluenceMocks,
+        page_path: Path,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         """Test push command with --dry-run flag."""
-        import logging
 
-        from roundtripper.models import PushResult
-
-        caplog.set_level(logging.INFO)
-
-        page_path = tmp_path / "page"
-        page_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.push_page.return_value = PushResult(pages_updated=0, pages_skipped=1)
-        mocker.patch("roundtripper.confluence.PushService", return_value=mock_service_instance)
+        mocked_confluence.push.push_page.return_value = PushResult(pages_updated=0, pages_skipped=1)
 
         app(
             ["confluence", "push", "Dry run test", "--page-path", str(page_path), "--dry-run"],
@@ -906,24 +679,13 @@ class TestConfluencePushCommand:
         )
 
         # Verify dry_run output is shown in logs
-        assert "DRY RUN" in caplog.text
+        assert _missing_log_messages(caplog.records, ["DRY RUN"]) == []
 
     def test_push_force_flag(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
+        self, patched_config_path: Path, mocked_confluence: ConfluenceMocks, page_path: Path
     ) -> None:
         """Test push command passes --force flag to service."""
-        from roundtripper.models import PushResult
-
-        page_path = tmp_path / "page"
-        page_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_class = mocker.patch("roundtripper.confluence.PushService")
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.push_page.return_value = PushResult(pages_updated=1)
-        mock_service_class.return_value = mock_service_instance
+        mocked_confluence.push.push_page.return_value = PushResult(pages_updated=1)
 
         app(
             [
@@ -939,27 +701,19 @@ class TestConfluencePushCommand:
         )
 
         # Verify PushService was instantiated with force=True and interactive=False
-        mock_service_class.assert_called_once_with(
-            mock_client, message="Force push", dry_run=False, force=True, interactive=False
+        mocked_confluence.push_factory.assert_called_once_with(
+            mocked_confluence.client,
+            message="Force push",
+            dry_run=False,
+            force=True,
+            interactive=False,
         )
 
     def test_push_verbose_flag(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
+        self, patched_config_path: Path, mocked_confluence: ConfluenceMocks, page_path: Path
     ) -> None:
         """Test push command with --verbose flag enables debug logging."""
-        import logging
-
-        from roundtripper.models import PushResult
-
-        page_path = tmp_path / "page"
-        page_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.push_page.return_value = PushResult(pages_updated=1)
-        mocker.patch("roundtripper.confluence.PushService", return_value=mock_service_instance)
+        mocked_confluence.push.push_page.return_value = PushResult(pages_updated=1)
 
         app(
             [
@@ -978,182 +732,59 @@ class TestConfluencePushCommand:
         assert logging.getLogger("roundtripper").level == logging.DEBUG
 
 
+@pytest.mark.usefixtures("info_logs")
 class TestDiffCommand:
     """Test the confluence diff command."""
 
-    def test_diff_requires_space_or_page_id(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
-    ) -> None:
-        """Test that diff command requires --space or --page-id."""
-        local_path = tmp_path / "local"
-        local_path.mkdir()
-
-        with pytest.raises(SystemExit) as exc_info:
-            app(
-                ["confluence", "diff", "--local-path", str(local_path)],
-                result_action="return_value",
-            )
-
-        assert exc_info.value.code == 1
-
-    def test_diff_rejects_both_space_and_page_id(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
-    ) -> None:
-        """Test that diff command rejects both --space and --page-id."""
-        local_path = tmp_path / "local"
-        local_path.mkdir()
-
-        with pytest.raises(SystemExit) as exc_info:
-            app(
-                [
-                    "confluence",
-                    "diff",
-                    "--local-path",
-                    str(local_path),
-                    "--space",
-                    "SPACE",
-                    "--page-id",
-                    "12345",
-                ],
-                result_action="return_value",
-            )
-
-        assert exc_info.value.code == 1
-
-    def test_diff_requires_existing_local_path(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
-    ) -> None:
-        """Test that diff command requires local path to exist."""
-        local_path = tmp_path / "nonexistent"
-
-        with pytest.raises(SystemExit) as exc_info:
-            app(
-                [
-                    "confluence",
-                    "diff",
-                    "--local-path",
-                    str(local_path),
-                    "--space",
-                    "SPACE",
-                ],
-                result_action="return_value",
-            )
-
-        assert exc_info.value.code == 1
-
-    def test_diff_space_success_no_changes(
-        self,
-        mocker: MockerFixture,
-        temp_config_file: Path,
-        tmp_path: Path,
-        caplog: pytest.LogCaptureFixture,
-    ) -> None:
-        """Test diff command with space when there are no changes."""
-        import logging
-
-        from roundtripper.models import DiffResult
-
-        caplog.set_level(logging.INFO)
-
-        local_path = tmp_path / "local"
-        local_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.diff_space.return_value = DiffResult(has_differences=False)
-        mocker.patch("roundtripper.confluence.DiffService", return_value=mock_service_instance)
-
-        app(
-            ["confluence", "diff", "--local-path", str(local_path), "--space", "SPACE"],
-            result_action="return_value",
-        )
-
-        # Verify log message
-        assert "no differences" in caplog.text
-
-    def test_diff_space_with_changes(
+    @pytest.mark.parametrize(
+        ("result", "expectation", "expected_log"),
+        [
+            (DiffResult(has_differences=False), nullcontext(), "no differences"),
+            (
+                DiffResult(has_differences=True),
+                pytest.raises(SystemExit, match="^1$"),
+                "differences found",
+            ),
+            (
+                DiffResult(has_differences=False, errors=["API Error: Permission denied"]),
+                pytest.raises(SystemExit, match="^1$"),
+                "Errors encountered",
+            ),
+        ],
+        ids=["no-changes", "changes", "errors"],
+    )
+    def test_diff_space(
         self,
-        mocker: MockerFixture,
-        temp_config_file: Path,
-        tmp_path: Path,
+        patched_config_path: Path,
+        mocked_confluence: ConfluenceMocks,
+        local_path: Path,
         caplog: pytest.LogCaptureFixture,
+        result: DiffResult,
+        expectation: AbstractContextManager[object],
+        expected_log: str,
     ) -> None:
-        """Test diff command with space when there are changes."""
-        import logging
-
-        from roundtripper.models import DiffResult
-
-        caplog.set_level(logging.INFO)
-
-        local_path = tmp_path / "local"
-        local_path.mkdir()
+        """Test diff command exits with code 1 when there are differences or errors."""
+        mocked_confluence.diff.diff_space.return_value = result
 
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.diff_space.return_value = DiffResult(has_differences=True)
-        mocker.patch("roundtripper.confluence.DiffService", return_value=mock_service_instance)
-
-        with pytest.raises(SystemExit) as exc_info:
+        with expectation:
             app(
-                ["confluence", "diff", "--local-path", str(local_path), "--space", "SPACE"],
+                ["confluence", "diff", "--local-path", str(local_path), "--space", "S"],
                 result_action="return_value",
             )
 
-        # Should exit with code 1 when differences exist
-        assert exc_info.value.code == 1
-        assert "differences found" in caplog.text
-
-    def test_diff_page_recursive(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
-    ) -> None:
-        """Test diff command with page and recursive flag."""
-        from roundtripper.models import DiffResult
-
-        local_path = tmp_path / "local"
-        local_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.diff_page.return_value = DiffResult(has_differences=False)
-        mocker.patch("roundtripper.confluence.DiffService", return_value=mock_service_instance)
-
-        app(
-            [
-                "confluence",
-                "diff",
-                "--local-path",
-                str(local_path),
-                "--page-id",
-                "12345",
-                "--recursive",
-            ],
-            result_action="return_value",
-        )
-
-        # Verify diff_page was called with recursive=True
-        mock_service_instance.diff_page.assert_called_once_with(12345, recursive=True)
+        assert _missing_log_messages(caplog.records, [expected_log]) == []
+        mocked_confluence.diff.diff_space.assert_called_once_with("S")
 
-    def test_diff_page_non_recursive(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
+    @pytest.mark.parametrize("recursive", [True, False], ids=["recursive", "no-recursive"])
+    def test_diff_page(
+        self,
+        patched_config_path: Path,
+        mocked_confluence: ConfluenceMocks,
+        local_path: Path,
+        recursive: bool,
     ) -> None:
-        """Test diff command with page and --no-recursive flag."""
-        from roundtripper.models import DiffResult
-
-        local_path = tmp_path / "local"
-        local_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.diff_page.return_value = DiffResult(has_differences=False)
-        mocker.patch("roundtripper.confluence.DiffService", return_value=mock_service_instance)
+        """Test diff command passes the page ID and recursive flag to the service."""
+        mocked_confluence.diff.diff_page.return_value = DiffResult(has_differences=False)
 
         app(
             [
@@ -1163,67 +794,18 @@ class TestDiffCommand:
                 str(local_path),
                 "--page-id",
                 "12345",
-                "--no-recursive",
+                "--recursive" if recursive else "--no-recursive",
             ],
             result_action="return_value",
         )
 
-        # Verify diff_page was called with recursive=False
-        mock_service_instance.diff_page.assert_called_once_with(12345, recursive=False)
-
-    def test_diff_with_errors(
-        self,
-        mocker: MockerFixture,
-        temp_config_file: Path,
-        tmp_path: Path,
-        caplog: pytest.LogCaptureFixture,
-    ) -> None:
-        """Test diff command exits with error when errors occur."""
-        import logging
-
-        from roundtripper.models import DiffResult
-
-        caplog.set_level(logging.INFO)
-
-        local_path = tmp_path / "local"
-        local_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.diff_space.return_value = DiffResult(
-            has_differences=False,
-            errors=["API Error: Permission denied"],
-        )
-        mocker.patch("roundtripper.confluence.DiffService", return_value=mock_service_instance)
-
-        with pytest.raises(SystemExit) as exc_info:
-            app(
-                ["confluence", "diff", "--local-path", str(local_path), "--space", "SPACE"],
-                result_action="return_value",
-            )
-
-        assert exc_info.value.code == 1
-        assert "Errors encountered" in caplog.text
+        mocked_confluence.diff.diff_page.assert_called_once_with(12345, recursive=recursive)
 
     def test_diff_verbose_flag(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
+        self, patched_config_path: Path, mocked_confluence: ConfluenceMocks, local_path: Path
     ) -> None:
         """Test diff command with --verbose flag enables debug logging."""
-        import logging
-
-        from roundtripper.models import DiffResult
-
-        local_path = tmp_path / "local"
-        local_path.mkdir()
-
-        mock_client = mocker.MagicMock()
-        mocker.patch("roundtripper.confluence.get_confluence_client", return_value=mock_client)
-
-        mock_service_instance = mocker.MagicMock()
-        mock_service_instance.diff_space.return_value = DiffResult(has_differences=False)
-        mocker.patch("roundtripper.confluence.DiffService", return_value=mock_service_instance)
+        mocked_confluence.diff.diff_space.return_value = DiffResult(has_differences=False)
 
         app(
             [
@@ -1241,22 +823,76 @@ class TestDiffCommand:
         # Verify debug logging is enabled for roundtripper logger
         assert logging.getLogger("roundtripper").level == logging.DEBUG
 
-    def test_diff_connection_error(
-        self, mocker: MockerFixture, temp_config_file: Path, tmp_path: Path
+
+class TestCommandErrors:
+    """Test that the pull, push, and diff commands fail on bad arguments and connections.
+
+    Paths in the arguments are relative to the shared directory from ``shared_dir``.
+    """
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["confluence", "pull"],
+            ["confluence", "pull", "--space", "SPACE", "--page-id", "123"],
+            ["confluence", "push", "Test message"],
+            ["confluence", "push", "Test message", "--page-path", "page", "--space-path", "space"],
+            ["confluence", "push", "Test message", "--page-path", "nonexistent"],
+            ["confluence", "diff", "--local-path", "local"],
+            ["confluence", "diff", "--local-path", "local", "--space", "SPACE", "--page-id", "1"],
+            ["confluence", "diff", "--local-path", "nonexistent", "--space", "SPACE"],
+        ],
+        ids=[
+            "pull-no-space-or-page-id",
+            "pull-both-space-and-page-id",
+            "push-no-path",
+            "push-both-paths",
+            "push-nonexistent-path",
+            "diff-no-space-or-page-id",
+            "diff-both-space-and-page-id",
+            "diff-nonexistent-local-path",
+        ],
+    )
+    def test_usage_errors(
+        self,
+        patched_config_path: Path,
+        shared_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        null_console: Console,
+        argv: list[str],
     ) -> None:
-        """Test diff command handles connection errors."""
-        local_path = tmp_path / "local"
-        local_path.mkdir()
+        """Test that invalid argument combinations exit with code 1."""
+        monkeypatch.chdir(shared_dir)
 
-        mocker.patch(
-            "roundtripper.confluence.get_confluence_client",
-            side_effect=ConnectionError("Connection failed"),
-        )
+        with pytest.raises(SystemExit) as exc_info:
+            app(argv, console=null_console, result_action="return_value")
+
+        assert exc_info.value.code == 1
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["confluence", "pull", "--space", "SPACE"],
+            ["confluence", "push", "Test message", "--page-path", "page"],
+            ["confluence", "diff", "--local-path", "local", "--space", "SPACE"],
+        ],
+        ids=["pull", "push", "diff"],
+    )
+    def test_connection_error(
+        self,
+        patched_config_path: Path,
+        shared_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_get_client: MagicMock,
+        null_console: Console,
+        argv: list[str],
+    ) -> None:
+        """Test that a failed connection exits with code 1."""
+        monkeypatch.chdir(shared_dir)
+        mock_get_client.side_effect = ConnectionError("Failed to connect")
 
         with pytest.raises(SystemExit) as exc_info:
-            app(
-                ["confluence", "diff", "--local-path", str(local_path), "--space", "SPACE"],
-                result_action="return_value",
-            )
+            app(argv, console=null_console, result_action="return_value")
 
         assert exc_info.value.code == 1
+        mock_get_client.assert_called_once()
@@ -1,8 +1,17 @@
 """Tests for configuration models."""
 
+import pytest
+from pydantic import AnyHttpUrl
+
 from roundtripper.config import ApiDetails, AuthConfig, ConfigModel, ConnectionConfig
 
 
+@pytest.fixture(scope="module")
+def default_config() -> ConfigModel:
+    """Shared default ``ConfigModel``; tests must not mutate it."""
+    return ConfigModel()
+
+
 class TestConnectionConfig:
     """Test ConnectionConfig model."""
 
@@ -14,6 +23,7 @@ class TestConnectionConfig:
         assert config.max_backoff_seconds == 60
         assert config.max_backoff_retries == 5
         assert config.retry_status_codes == [413, 429, 502, 503, 504]
+        assert config.pool_maxsize == 32
         assert config.verify_ssl is True
 
     def test_custom_values(self) -> None:
@@ -49,6 +59,7 @@ class TestApiDetails:
         """Test that ApiDetails has correct default values."""
         api = ApiDetails()
         assert api.url == ""
+        assert api.url_str == ""
         assert api.username.get_secret_value() == ""
         assert api.api_token.get_secret_value() == ""
         assert api.pat.get_secret_value() == ""
@@ -64,6 +75,7 @@ class TestApiDetails:
             }
         )
         assert str(api.url) == "https://example.atlassian.net/"
+        assert api.url_str == "https://example.atlassian.net/"
         assert api.username.get_secret_value() == "user@example.com"
         assert api.api_token.get_secret_value() == "token123"
         assert api.pat.get_secret_value() == "pat456"
@@ -81,6 +93,24 @@ class TestApiDetails:
         assert "user@example.com" in json_str
         assert "token123" in json_str
 
+    def test_url_str_is_not_serialized(self) -> None:
+        """Test that the URL string is not written to the config file."""
+        api = ApiDetails.model_validate({"url": "https://example.atlassian.net"})
+        assert api.url_str == "https://example.atlassian.net/"
+        assert "url_str" not in api.model_dump()
+        assert "url_str" not in api.model_dump_json()
+
+    def test_url_str_follows_url_changes(self) -> None:
+        """Test that the URL string reflects later assignments and copies."""
+        api = ApiDetails.model_validate({"url": "https://example.atlassian.net"})
+        assert api.url_str == "https://example.atlassian.net/"
+
+        copy = api.model_copy(update={"url": AnyHttpUrl("https://other.atlassian.net")})
+        assert copy.url_str == "https://other.atlassian.net/"
+
+        api.url = AnyHttpUrl("https://third.atlassian.net")
+        assert api.url_str == "https://third.atlassian.net/"
+
     def test_url_validation(self) -> None:
         """Test URL validation."""
         # Valid URL
@@ -119,11 +149,10 @@ class TestAuthConfig:
 class TestConfigModel:
     """Test ConfigModel (top-level configuration)."""
 
-    def test_default_values(self) -> None:
+    def test_default_values(self, default_config: ConfigModel) -> None:
         """Test that ConfigModel has correct default values."""
-        config = ConfigModel()
-        assert isinstance(config.connection_config, ConnectionConfig)
-        assert isinstance(config.auth, AuthConfig)
+        assert isinstance(default_config.connection_config, ConnectionConfig)
+        assert isinstance(default_config.auth, AuthConfig)
 
     def test_nested_structure(self) -> None:
         """Test that nested structure works correctly."""
@@ -141,10 +170,9 @@ class TestConfigModel:
         assert config.connection_config.verify_ssl is False
         assert str(config.auth.confluence.url) == "https://example.atlassian.net/"
 
-    def test_model_dump(self) -> None:
+    def test_model_dump(self, default_config: ConfigModel) -> None:
         """Test that model_dump returns correct structure."""
-        config = ConfigModel()
-        data = config.model_dump()
+        data = default_config.model_dump()
         assert isinstance(data, dict)
         assert "connection_config" in data
         assert "auth" in data
@@ -1,15 +1,21 @@
 """Tests for configuration storage."""
 
 import json
+import os
+import stat
 from pathlib import Path
+from typing import Self
 
 import pytest
+from pydantic import model_validator
 
+from roundtripper import config_store
 from roundtripper.config import ConfigModel, ConnectionConfig
 from roundtripper.config_store import (
     get_app_config_path,
     get_default_value_by_path,
     get_settings,
+    invalidate_settings,
     load_app_data,
     reset_to_defaults,
     save_app_data,
@@ -30,6 +36,19 @@ def temp_config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     return config_dir
 
 
+def _count_reads(monkeypatch: pytest.MonkeyPatch) -> list[ConfigModel]:
+    """Record the settings read from the config file, returning the list they are appended to."""
+    reads: list[ConfigModel] = []
+    read_settings = config_store._read_settings
+
+    def counting_read_settings() -> ConfigModel:
+        reads.append(read_settings())
+        return reads[-1]
+
+    monkeypatch.setattr(config_store, "_read_settings", counting_read_settings)
+    return reads
+
+
 class TestGetAppConfigPath:
     """Test get_app_config_path function."""
 
@@ -103,6 +122,17 @@ class TestLoadAppData:
         assert data["connection_config"]["verify_ssl"] is False
         assert "example.atlassian.net" in str(data["auth"]["confluence"]["url"])
 
+    def test_load_non_object_json(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test loading when the config file holds valid JSON that is not an object."""
+        config_file = temp_config_dir / "config.json"
+        monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", config_file)
+
+        config_file.write_text("[]")
+
+        assert load_app_data() == ConfigModel().model_dump()
+
     def test_load_invalid_json(
         self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -172,6 +202,69 @@ class TestSaveAppData:
 
         assert config_file.exists()
 
+    def test_save_replaces_file_atomically(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that save keeps the file mode and leaves no temporary file behind."""
+        config_file = temp_config_dir / "config.json"
+        monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", config_file)
+        config_file.write_text("{}")
+        config_file.chmod(0o640)
+
+        save_app_data(ConfigModel(connection_config=ConnectionConfig(verify_ssl=False)))
+
+        assert stat.S_IMODE(config_file.stat().st_mode) == 0o640
+        assert json.loads(config_file.read_text())["connection_config"]["verify_ssl"] is False
+        assert [p.name for p in temp_config_dir.iterdir()] == ["config.json"]
+
+    def test_save_new_file_owner_only(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a newly created config file is only accessible by the owner."""
+        config_file = temp_config_dir / "config.json"
+        monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", config_file)
+
+        save_app_data(ConfigModel())
+
+        assert stat.S_IMODE(config_file.stat().st_mode) == 0o600
+
+    def test_save_handles_short_writes(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the whole config is written even if os.write writes only part of it."""
+        config_file = temp_config_dir / "config.json"
+        monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", config_file)
+        real_write = os.write
+
+        def short_write(fd: int, data: bytes) -> int:
+            return real_write(fd, data[:10])
+
+        monkeypatch.setattr(os, "write", short_write)
+        config = ConfigModel(connection_config=ConnectionConfig(verify_ssl=False))
+
+        save_app_data(config)
+
+        assert ConfigModel.model_validate_json(config_file.read_bytes()) == config
+
+    def test_save_failure_keeps_old_file(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a failed write leaves the previous config and no temporary file."""
+        config_file = temp_config_dir / "config.json"
+        monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", config_file)
+        config_file.write_text("{}")
+
+        def fail_fsync(fd: int) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "fsync", fail_fsync)
+
+        with pytest.raises(OSError, match="disk full"):
+            save_app_data(ConfigModel())
+
+        assert config_file.read_text() == "{}"
+        assert [p.name for p in temp_config_dir.iterdir()] == ["config.json"]
+
 
 class TestGetSettings:
     """Test get_settings function."""
@@ -202,6 +295,64 @@ class TestGetSettings:
         settings = get_settings()
         assert settings.connection_config.verify_ssl is False
 
+    def test_settings_are_cached(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the config file is only read again once it changes."""
+        config_file = temp_config_dir / "config.json"
+        monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", config_file)
+        reads = _count_reads(monkeypatch)
+
+        settings = get_settings()
+        assert get_settings() == settings
+        assert len(reads) == 1
+
+        config_file.write_text(json.dumps({"connection_config": {"verify_ssl": False}}))
+        assert get_settings().connection_config.verify_ssl is False
+        assert len(reads) == 2
+
+    def test_settings_are_copies(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that changing returned or saved settings does not change the cached ones."""
+        config_file = temp_config_dir / "config.json"
+        monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", config_file)
+
+        get_settings().connection_config.verify_ssl = False
+        assert get_settings().connection_config.verify_ssl is True
+
+        config = ConfigModel()
+        save_app_data(config)
+        config.connection_config.verify_ssl = False
+        assert get_settings().connection_config.verify_ssl is True
+
+    def test_invalidate_settings(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that invalidate_settings forces the config file to be read again."""
+        config_file = temp_config_dir / "config.json"
+        monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", config_file)
+        reads = _count_reads(monkeypatch)
+
+        get_settings()
+        invalidate_settings()
+        get_settings()
+        assert len(reads) == 2
+
+    def test_save_invalidates_cache(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that saving the config refreshes the cached settings."""
+        config_file = temp_config_dir / "config.json"
+        monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", config_file)
+
+        assert get_settings().connection_config.verify_ssl is True
+        set_setting("connection_config.verify_ssl", False)
+
+        settings = get_settings()
+        assert settings.connection_config.verify_ssl is False
+        assert settings == ConfigModel.model_validate_json(config_file.read_text())
+
 
 class TestSetSetting:
     """Test set_setting function."""
@@ -240,6 +391,61 @@ class TestSetSetting:
         with pytest.raises(ValueError):
             set_setting("connection_config.max_backoff_retries", "not_a_number")
 
+    def test_set_invalid_combination(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that validators spanning several fields reject the new settings."""
+        config_file = temp_config_dir / "config.json"
+        monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", config_file)
+
+        class CheckedConfigModel(ConfigModel):
+            @model_validator(mode="after")
+            def check_backoff(self) -> Self:
+                connection_config = self.connection_config
+                if connection_config.backoff_factor > connection_config.max_backoff_seconds:
+                    msg = "backoff_factor must not exceed max_backoff_seconds"
+                    raise ValueError(msg)
+                return self
+
+        monkeypatch.setattr(config_store, "ConfigModel", CheckedConfigModel)
+
+        with pytest.raises(ValueError, match="backoff_factor must not exceed"):
+            set_setting("connection_config.backoff_factor", 120)
+        assert not config_file.exists()
+
+        set_setting("connection_config.backoff_factor", 30)
+        assert get_settings().connection_config.backoff_factor == 30
+
+    @pytest.mark.parametrize(
+        "path", ["invalid.path", "connection_config.unknown", "connection_config.verify_ssl.x"]
+    )
+    def test_set_invalid_path(
+        self, path: str, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that setting an unknown path raises KeyError and leaves the file alone."""
+        config_file = temp_config_dir / "config.json"
+        monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", config_file)
+
+        with pytest.raises(KeyError, match="Invalid config path"):
+            set_setting(path, True)
+        assert not config_file.exists()
+
+    def test_set_does_not_mutate_cached_settings(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that set_setting builds new settings instead of changing the cached ones."""
+        config_file = temp_config_dir / "config.json"
+        monkeypatch.setattr("roundtripper.config_store.APP_CONFIG_PATH", config_file)
+
+        before = get_settings()
+        assert before.auth.confluence.url_str == ""
+        set_setting("auth.confluence.url", "https://example.atlassian.net")
+
+        after = get_settings()
+        assert before.auth.confluence.url_str == ""
+        assert after.auth.confluence.url_str == "https://example.atlassian.net/"
+        assert after.connection_config == before.connection_config
+
     def test_set_creates_nested_path(
         self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -302,6 +508,13 @@ class TestGetDefaultValueByPath:
         assert isinstance(defaults, dict)
         assert "confluence" in defaults
 
+    def test_returns_independent_copies(self) -> None:
+        """Test that mutating a returned default does not change later results."""
+        expected = ConnectionConfig().retry_status_codes
+        defaults = get_default_value_by_path("connection_config")
+        defaults["retry_status_codes"].append(500)
+        assert get_default_value_by_path("connection_config.retry_status_codes") == expected
+
     def test_get_invalid_path(self) -> None:
         """Test that invalid path raises KeyError."""
         with pytest.raises(KeyError, match="Invalid config path"):
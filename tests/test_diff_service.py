@@ -1,6 +1,10 @@
 """Tests for DiffService."""
 
+import contextlib
+import os
 import subprocess
+import sys
+import threading
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
@@ -8,10 +12,69 @@ from unittest.mock import MagicMock
 import pytest
 from pytest_mock import MockerFixture
 
-from roundtripper.diff_service import DiffService
+from roundtripper.diff_service import _DIFF_CHUNK_SIZE, DiffService
 from roundtripper.models import DiffResult
 
 
+def _mock_processes(
+    mocker: MockerFixture,
+    diff_stdout: bytes = b"",
+    diff_returncode: int = 0,
+    diff_stderr: bytes = b"",
+    pager_returncode: int = 0,
+    stdout_isatty: bool = True,
+    diff_hangs: bool = False,
+) -> tuple[MagicMock, MagicMock, MagicMock]:
+    """Patch ``subprocess.Popen`` to start a fake diff process and a fake pager process.
+
+    The fake diff writes ``diff_stdout`` to a real pipe from a thread; if ``diff_hangs`` is
+    true, it then keeps the pipe open until it is killed.
+    Stdout is reported as a terminal unless ``stdout_isatty`` is false, so that the pager is used.
+    xmllint is reported as missing so that pulling pages starts no other process.
+    Returns the ``Popen`` mock, the diff process and the pager process.
+    """
+    mocker.patch.object(sys.stdout, "isatty", return_value=stdout_isatty)
+    mocker.patch("roundtripper.file_utils.is_xmllint_available", return_value=False)
+    read_fd, write_fd = os.pipe()
+    killed = threading.Event()
+    diff_process = MagicMock()
+    diff_process.__enter__.return_value = diff_process
+    diff_process.stdout = open(read_fd, "rb", buffering=0)  # noqa: SIM115
+    diff_process.wait.return_value = diff_returncode
+    diff_process.kill.side_effect = killed.set
+    # Like Popen, close the pipe when leaving the with block
+    diff_process.__exit__.side_effect = lambda *args: diff_process.stdout.close()
+
+    def write_diff_stdout() -> None:
+        with contextlib.suppress(BrokenPipeError), open(write_fd, "wb") as stdout:
+            stdout.write(diff_stdout)
+            stdout.flush()
+            if diff_hangs:
+                killed.wait()
+
+    threading.Thread(target=write_diff_stdout, daemon=True).start()
+    pager_process = MagicMock()
+    pager_process.wait.return_value = pager_returncode
+
+    def popen(cmd: list[str], **kwargs: Any) -> MagicMock:
+        if cmd[0] == "diff":
+            kwargs["stderr"].write(diff_stderr)
+            return diff_process
+        if cmd == os.environ.get("PAGER", "less -R").split():
+            if isinstance(pager_process.side_effect, OSError):
+                raise pager_process.side_effect
+            return pager_process
+        msg = f"Unexpected command: {cmd}"
+        raise AssertionError(msg)
+
+    return mocker.patch("subprocess.Popen", side_effect=popen), diff_process, pager_process
+
+
+def _paged(pager_process: MagicMock) -> bytes:
+    """Return all bytes written to the fake pager's stdin."""
+    return b"".join(call.args[0] for call in pager_process.stdin.write.call_args_list)
+
+
 @pytest.fixture
 def mock_client() -> MagicMock:
     """Create a mock Confluence client."""
@@ -86,10 +149,8 @@ class TestDiffSpace:
         # Mock attachments
         mock_client.get_attachments_from_content.return_value = {"results": []}
 
-        # Mock subprocess.run for diff command
-        mock_run = mocker.patch("subprocess.run")
         # diff returns 0 when there are no changes
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        _mock_processes(mocker)
 
         result = diff_service.diff_space("SPACE")
 
@@ -128,30 +189,26 @@ class TestDiffSpace:
         # Mock attachments
         mock_client.get_attachments_from_content.return_value = {"results": []}
 
-        # Mock subprocess.run for diff command
-        mock_run = mocker.patch("subprocess.run")
         # diff returns 1 when there are changes
         diff_output = (
-            "--- local/SPACE/Test Page/page.xml\n"
-            "+++ remote/SPACE/Test Page/page.xml\n"
-            "@@ -1 +1 @@\n"
-            "-<p>Local content</p>\n"
-            "+<p>Remote content changed</p>\n"
+            b"--- local/SPACE/Test Page/page.xml\n"
+            b"+++ remote/SPACE/Test Page/page.xml\n"
+            b"@@ -1 +1 @@\n"
+            b"-<p>Local content</p>\n"
+            b"+<p>Remote content changed</p>\n"
+        )
+        mock_popen, _, pager_process = _mock_processes(
+            mocker, diff_stdout=diff_output, diff_returncode=1
         )
-        mock_run.return_value = MagicMock(returncode=1, stdout=diff_output, stderr="")
-
-        # Mock Popen for pager
-        mock_popen = mocker.patch("subprocess.Popen")
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_popen.return_value = mock_process
 
         result = diff_service.diff_space("SPACE")
 
         assert result.has_differences is True
         assert len(result.errors) == 0
-        # Verify pager was called
-        mock_popen.assert_called_once()
+        # Verify pager was started after a colored diff and fed the raw diff bytes
+        assert mock_popen.call_count == 2
+        assert "--color=always" in mock_popen.call_args_list[0].args[0]
+        assert _paged(pager_process) == diff_output
 
     def test_diff_space_pull_errors(
         self,
@@ -174,9 +231,8 @@ class TestDiffSpace:
         # Mock search for descendants
         mock_client.get.return_value = {"results": [], "_links": {}}
 
-        # Mock subprocess.run for diff command
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        # diff returns 0 when there are no changes
+        _mock_processes(mocker)
 
         result = diff_service.diff_space("SPACE")
 
@@ -208,9 +264,8 @@ class TestDiffPage:
         # Mock attachments
         mock_client.get_attachments_from_content.return_value = {"results": []}
 
-        # Mock subprocess.run for diff command
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        # diff returns 0 when there are no changes
+        _mock_processes(mocker)
 
         result = diff_service.diff_page(12345)
 
@@ -262,9 +317,8 @@ class TestDiffPage:
         # Mock attachments
         mock_client.get_attachments_from_content.return_value = {"results": []}
 
-        # Mock subprocess.run for diff command
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        # diff returns 0 when there are no changes
+        _mock_processes(mocker)
 
         result = diff_service.diff_page(12345, recursive=True)
 
@@ -286,18 +340,12 @@ class TestRunDiff:
         remote_dir = tmp_path / "remote"
         remote_dir.mkdir()
 
-        # Mock subprocess.run to simulate diff failure (returncode > 1)
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
-            returncode=2,
-            stdout="",
-            stderr="diff: error occurred",
-        )
+        # Simulate diff failure (returncode > 1)
+        _mock_processes(mocker, diff_returncode=2, diff_stderr=b"diff: error occurred")
 
         diff_service._run_diff(local_content_dir, remote_dir)
 
-        assert len(diff_service.result.errors) > 0
-        assert "Diff command failed" in diff_service.result.errors[0]
+        assert diff_service.result.errors == ["Diff command failed: diff: error occurred"]
 
     def test_diff_command_timeout(
         self,
@@ -310,14 +358,44 @@ class TestRunDiff:
         remote_dir = tmp_path / "remote"
         remote_dir.mkdir()
 
-        # Mock subprocess.run to raise TimeoutExpired
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.side_effect = subprocess.TimeoutExpired("diff", 30)
+        # Make waiting for diff raise TimeoutExpired
+        _, diff_process, _ = _mock_processes(mocker)
+        diff_process.wait.side_effect = subprocess.TimeoutExpired("diff", 30)
 
         diff_service._run_diff(local_content_dir, remote_dir)
 
         assert len(diff_service.result.errors) > 0
         assert "timed out" in diff_service.result.errors[0]
+        diff_process.kill.assert_called_once()
+
+    @pytest.mark.parametrize("diff_stdout", [b"", b"--- a/file.txt\n"], ids=["silent", "partial"])
+    def test_diff_output_timeout(
+        self,
+        diff_stdout: bytes,
+        diff_service: DiffService,
+        local_content_dir: Path,
+        tmp_path: Path,
+        mocker: MockerFixture,
+        capsysbinary: pytest.CaptureFixture[bytes],
+    ) -> None:
+        """Test that diff is killed if it stops producing output."""
+        remote_dir = tmp_path / "remote"
+        remote_dir.mkdir()
+
+        mocker.patch("roundtripper.diff_service._DIFF_TIMEOUT", 0.1)
+        _, diff_process, pager_process = _mock_processes(
+            mocker, diff_stdout=diff_stdout, diff_returncode=1, diff_hangs=True
+        )
+
+        diff_service._run_diff(local_content_dir, remote_dir)
+
+        assert diff_service.result.errors == ["Diff command timed out"]
+        diff_process.kill.assert_called_once()
+        diff_process.wait.assert_not_called()
+        assert _paged(pager_process) == diff_stdout
+        if diff_stdout:
+            pager_process.stdin.close.assert_called_once()
+            pager_process.wait.assert_called_once()
 
     def test_diff_command_not_found(
         self,
@@ -330,10 +408,10 @@ class TestRunDiff:
         remote_dir = tmp_path / "remote"
         remote_dir.mkdir()
 
-        # Mock subprocess.run to raise FileNotFoundError
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.side_effect = FileNotFoundError()
-        mock_run.side_effect.filename = "diff"
+        # Mock subprocess.Popen to raise FileNotFoundError
+        mock_popen = mocker.patch("subprocess.Popen")
+        mock_popen.side_effect = FileNotFoundError()
+        mock_popen.side_effect.filename = "diff"
 
         diff_service._run_diff(local_content_dir, remote_dir)
 
@@ -352,23 +430,46 @@ class TestRunDiff:
         remote_dir = tmp_path / "remote"
         remote_dir.mkdir()
 
-        diff_output = "--- a/file.txt\n+++ b/file.txt\n@@ -1 +1 @@\n-old\n+new\n"
+        diff_output = b"--- a/file.txt\n+++ b/file.txt\n@@ -1 +1 @@\n-old\n+new\n"
 
-        # Mock subprocess.run for diff command
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(returncode=1, stdout=diff_output, stderr="")
-
-        # Mock Popen for pager to fail
-        mock_popen = mocker.patch("subprocess.Popen")
-        mock_process = MagicMock()
-        mock_process.returncode = 1  # Pager failed
-        mock_popen.return_value = mock_process
+        # Make the pager fail
+        _mock_processes(mocker, diff_stdout=diff_output, diff_returncode=1, pager_returncode=1)
 
         diff_service._run_diff(local_content_dir, remote_dir)
 
         # Should have fallen back to direct print
         captured = capsys.readouterr()
-        assert diff_output in captured.out
+        assert diff_output.decode() in captured.out
+
+    def test_pager_not_found(
+        self,
+        diff_service: DiffService,
+        local_content_dir: Path,
+        tmp_path: Path,
+        mocker: MockerFixture,
+        monkeypatch: pytest.MonkeyPatch,
+        capsysbinary: pytest.CaptureFixture[bytes],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that a pager that cannot be started is named and the diff printed directly."""
+        remote_dir = tmp_path / "remote"
+        remote_dir.mkdir()
+        monkeypatch.setenv("PAGER", "no-such-pager")
+
+        diff_output = b"--- a/file.txt\n+++ b/file.txt\n"
+        _, diff_process, pager_process = _mock_processes(
+            mocker, diff_stdout=diff_output, diff_returncode=1
+        )
+        pager_process.side_effect = FileNotFoundError(2, "No such file", "no-such-pager")
+
+        diff_service._run_diff(local_content_dir, remote_dir)
+
+        assert diff_service.result.errors == []
+        assert diff_service.result.has_differences is True
+        assert capsysbinary.readouterr().out == diff_output
+        messages = [record.getMessage() for record in caplog.records]
+        assert any("Could not start pager 'no-such-pager'" in m for m in messages)
+        assert diff_process.stdout.closed
 
     def test_custom_pager_env(
         self,
@@ -385,24 +486,98 @@ class TestRunDiff:
         # Set custom pager
         monkeypatch.setenv("PAGER", "cat")
 
-        diff_output = "--- a/file.txt\n+++ b/file.txt\n"
-
-        # Mock subprocess.run for diff command
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(returncode=1, stdout=diff_output, stderr="")
+        diff_output = b"--- a/file.txt\n+++ b/file.txt\n"
 
-        # Mock Popen for pager
-        mock_popen = mocker.patch("subprocess.Popen")
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_popen.return_value = mock_process
+        mock_popen, _, _ = _mock_processes(mocker, diff_stdout=diff_output, diff_returncode=1)
 
         diff_service._run_diff(local_content_dir, remote_dir)
 
         # Verify pager was called with "cat" command
-        mock_popen.assert_called_once()
-        call_args = mock_popen.call_args
-        assert call_args[0][0] == ["cat"]
+        assert mock_popen.call_args.args[0] == ["cat"]
+
+    def test_streams_output_in_chunks(
+        self,
+        diff_service: DiffService,
+        local_content_dir: Path,
+        tmp_path: Path,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that diff output larger than one chunk is streamed to the pager in pieces."""
+        remote_dir = tmp_path / "remote"
+        remote_dir.mkdir()
+
+        diff_output = b"x" * (2 * _DIFF_CHUNK_SIZE + 1)
+        _, diff_process, pager_process = _mock_processes(
+            mocker, diff_stdout=diff_output, diff_returncode=1
+        )
+
+        diff_service._run_diff(local_content_dir, remote_dir)
+
+        assert diff_service.result.has_differences is True
+        assert _paged(pager_process) == diff_output
+        assert pager_process.stdin.write.call_count >= 3
+        assert diff_process.stdout.closed
+
+    @pytest.mark.parametrize(
+        ("pager_returncode", "expected_out"),
+        [(0, b""), (1, b"+first\n+second\n+third\n")],
+        ids=["quit", "failed"],
+    )
+    def test_pager_exits_early(
+        self,
+        pager_returncode: int,
+        expected_out: bytes,
+        diff_service: DiffService,
+        local_content_dir: Path,
+        tmp_path: Path,
+        mocker: MockerFixture,
+        capsysbinary: pytest.CaptureFixture[bytes],
+    ) -> None:
+        """Test that the diff is only printed directly if the pager exited with an error."""
+        remote_dir = tmp_path / "remote"
+        remote_dir.mkdir()
+
+        mocker.patch("roundtripper.diff_service._DIFF_CHUNK_SIZE", 8)
+        _, diff_process, pager_process = _mock_processes(
+            mocker,
+            diff_stdout=b"+first\n+second\n+third\n",
+            diff_returncode=1,
+            pager_returncode=pager_returncode,
+        )
+        pager_process.stdin.write.side_effect = [None, BrokenPipeError()]
+
+        diff_service._run_diff(local_content_dir, remote_dir)
+
+        assert diff_service.result.has_differences is True
+        assert diff_service.result.errors == []
+        assert capsysbinary.readouterr().out == expected_out
+        assert diff_process.stdout.closed
+
+    def test_no_pager_without_terminal(
+        self,
+        diff_service: DiffService,
+        local_content_dir: Path,
+        tmp_path: Path,
+        mocker: MockerFixture,
+        capsysbinary: pytest.CaptureFixture[bytes],
+    ) -> None:
+        """Test that the diff is written directly to stdout if it is not a terminal."""
+        remote_dir = tmp_path / "remote"
+        remote_dir.mkdir()
+
+        mocker.patch("roundtripper.diff_service._DIFF_CHUNK_SIZE", 8)
+        diff_output = b"--- a/file.txt\n+++ b/file.txt\n"
+        mock_popen, diff_process, _ = _mock_processes(
+            mocker, diff_stdout=diff_output, diff_returncode=1, stdout_isatty=False
+        )
+
+        diff_service._run_diff(local_content_dir, remote_dir)
+
+        assert diff_service.result.has_differences is True
+        assert capsysbinary.readouterr().out == diff_output
+        assert mock_popen.call_count == 1
+        assert "--color=never" in mock_popen.call_args.args[0]
+        assert diff_process.stdout.closed
 
     def test_diff_generic_exception(
         self,
@@ -415,9 +590,8 @@ class TestRunDiff:
         remote_dir = tmp_path / "remote"
         remote_dir.mkdir()
 
-        # Mock subprocess.run to raise a generic exception
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.side_effect = RuntimeError("Unexpected error")
+        # Mock subprocess.Popen to raise a generic exception
+        mocker.patch("subprocess.Popen", side_effect=RuntimeError("Unexpected error"))
 
         diff_service._run_diff(local_content_dir, remote_dir)
 
@@ -434,9 +608,8 @@ class TestRunDiff:
         # Mock page fetch to fail
         mock_client.get_page_by_id.side_effect = Exception("API Error")
 
-        # Mock subprocess.run for diff command
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        # diff returns 0 when there are no changes
+        _mock_processes(mocker)
 
         result = diff_service.diff_page(12345)
 
@@ -1,5 +1,6 @@
 """Tests for file utility functions."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -7,8 +8,12 @@ import pytest
 
 from roundtripper.file_utils import (
     build_page_path,
+    compute_content_hash,
+    compute_file_hash,
+    compute_page_hash,
     format_xml,
     is_xmllint_available,
+    load_json,
     sanitize_filename,
     save_file,
     save_json,
@@ -18,6 +23,13 @@ from roundtripper.file_utils import (
 class TestIsXmllintAvailable:
     """Tests for is_xmllint_available function."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Iterator[None]:
+        """Run each test against a fresh PATH lookup."""
+        is_xmllint_available.cache_clear()
+        yield
+        is_xmllint_available.cache_clear()
+
     def test_xmllint_available(self) -> None:
         """Test detection when xmllint is available."""
         with patch("shutil.which", return_value="/usr/bin/xmllint"):
@@ -28,6 +40,13 @@ class TestIsXmllintAvailable:
         with patch("shutil.which", return_value=None):
             assert is_xmllint_available() is False
 
+    def test_lookup_is_cached(self) -> None:
+        """Test that PATH is only searched once."""
+        with patch("shutil.which", return_value="/usr/bin/xmllint") as mock_which:
+            assert is_xmllint_available() is True
+            assert is_xmllint_available() is True
+        mock_which.assert_called_once_with("xmllint")
+
 
 class TestFormatXml:
     """Tests for format_xml function."""
@@ -287,6 +306,39 @@ class TestSaveJson:
         assert '"inner"' in content
 
 
+class TestLoadJson:
+    """Tests for load_json function."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test loading JSON written by save_json, including non-ASCII text."""
+        file_path = tmp_path / "test.json"
+        data = {"title": "Grüße", "version": {"number": 3}}
+        save_json(file_path, data)
+
+        assert load_json(file_path) == data
+
+
+class TestContentHashes:
+    """Tests for compute_content_hash, compute_page_hash and compute_file_hash functions."""
+
+    def test_str_and_bytes_hash_equal(self) -> None:
+        """Test that strings are hashed as their UTF-8 encoding."""
+        assert compute_content_hash("Grüße") == compute_content_hash("Grüße".encode())
+
+    def test_file_hash_matches_content_hash(self, tmp_path: Path) -> None:
+        """Test that hashing a file matches hashing its bytes."""
+        file_path = tmp_path / "data.bin"
+        file_path.write_bytes(b"\x00binary content\xff")
+
+        assert compute_file_hash(file_path) == compute_content_hash(b"\x00binary content\xff")
+
+    def test_page_hash_ignores_surrounding_whitespace(self) -> None:
+        """Test that page hashes ignore whitespace at either end but not inside."""
+        assert compute_page_hash("\n <p>A</p>\n") == compute_page_hash("<p>A</p>")
+        assert compute_page_hash("<p>A</p>") == compute_content_hash("<p>A</p>")
+        assert compute_page_hash("<p>A </p>") != compute_page_hash("<p>A</p>")
+
+
 class TestBuildPagePath:
     """Tests for build_page_path function."""
 
@@ -1,11 +1,14 @@
 """Tests for PullService."""
 
+import json
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
+from roundtripper.file_utils import compute_content_hash, compute_page_hash
 from roundtripper.pull_service import PullService
 
 
@@ -36,6 +39,17 @@ class TestPullServiceInit:
         service = PullService(client=mock_client, output_dir=tmp_path, dry_run=True)
         assert service.dry_run is True
 
+    def test_base_url_strips_trailing_slash(self, mock_client: MagicMock, tmp_path: Path) -> None:
+        """Test the base URL used for downloads has no trailing slash."""
+        mock_client.url = "https://confluence.example.com/"
+        service = PullService(client=mock_client, output_dir=tmp_path)
+        assert service.base_url == "https://confluence.example.com"
+
+    def test_max_workers(self, mock_client: MagicMock, tmp_path: Path) -> None:
+        """Test the number of concurrent page fetches is configurable."""
+        service = PullService(client=mock_client, output_dir=tmp_path, max_workers=2)
+        assert service.max_workers == 2
+
 
 class TestPullPage:
     """Tests for pulling a single page."""
@@ -60,8 +74,13 @@ class TestPullPage:
         assert result.pages_downloaded == 1
         assert result.attachments_downloaded == 0
         # Note: spaces preserved in directory names
-        assert (tmp_path / "SPACE" / "Test Page" / "page.xml").exists()
-        assert (tmp_path / "SPACE" / "Test Page" / "page.json").exists()
+        page_dir = tmp_path / "SPACE" / "Test Page"
+        assert (page_dir / "page.xml").exists()
+        assert (page_dir / "page.json").exists()
+        # The hash of the written XML is stored so push can skip unchanged pages
+        metadata = json.loads((page_dir / "page.json").read_text(encoding="utf-8"))
+        xml_content = (page_dir / "page.xml").read_text(encoding="utf-8")
+        assert metadata["local_content_hash"] == compute_page_hash(xml_content)
 
     def test_pull_page_with_ancestors(
         self, pull_service: PullService, mock_client: MagicMock, tmp_path: Path
@@ -217,8 +236,7 @@ class TestPullAttachments:
         mock_client.get_page_by_id.return_value = page_data
         mock_client.get_attachments_from_content.return_value = attachment_data
         # Mock the session.get() for downloading attachments
-        mock_response = MagicMock()
-        mock_response.content = b"file content"
+        mock_response = SimpleNamespace(content=b"file content", raise_for_status=lambda: None)
         mock_client._session.get.return_value = mock_response
 
         result = pull_service.pull_page(page_id=12345)
@@ -226,6 +244,12 @@ class TestPullAttachments:
         assert result.attachments_downloaded == 1
         attachment_path = tmp_path / "SPACE" / "Test Page" / "attachments" / "file.pdf"
         assert attachment_path.exists()
+        metadata_path = attachment_path.with_name("file.pdf.json")
+        metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+        assert metadata["local_content_hash"] == compute_content_hash(b"file content")
+        mock_client._session.get.assert_called_once_with(
+            "https://example.atlassian.net/wiki/download/attachments/12345/file.pdf"
+        )
 
     def test_skip_unchanged_attachments(self, mock_client: MagicMock, tmp_path: Path) -> None:
         """Test that unchanged attachments are skipped."""
@@ -252,8 +276,7 @@ class TestPullAttachments:
         mock_client.get_page_by_id.return_value = page_data
         mock_client.get_attachments_from_content.return_value = attachment_data
         # Mock the session.get() for downloading attachments
-        mock_response = MagicMock()
-        mock_response.content = b"file content"
+        mock_response = SimpleNamespace(content=b"file content", raise_for_status=lambda: None)
         mock_client._session.get.return_value = mock_response
 
         # First pull downloads the page and attachment
@@ -298,6 +321,37 @@ class TestPullSpace:
 
         assert result.pages_downloaded == 1
 
+    def test_pull_space_many_pages_concurrently(
+        self, pull_service: PullService, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that concurrently pulled pages are all saved and counted."""
+        space_data = {"key": "SPACE", "name": "Test Space", "homepage": {"id": "100"}}
+
+        def get_page_by_id_side_effect(page_id: int | str, expand: str = "") -> dict[str, Any]:
+            ancestors = [] if str(page_id) == "100" else [{"id": "100"}]
+            return {
+                "id": str(page_id),
+                "title": f"Page {page_id}",
+                "space": {"key": "SPACE"},
+                "body": {"storage": {"value": f"<p>{page_id}</p>"}},
+                "version": {"number": 1},
+                "ancestors": ancestors,
+            }
+
+        mock_client.get_space.return_value = space_data
+        mock_client.get.return_value = {
+            "results": [{"id": str(page_id)} for page_id in range(101, 131)],
+            "_links": {},
+        }
+        mock_client.get_page_by_id.side_effect = get_page_by_id_side_effect
+        mock_client.get_attachments_from_content.return_value = {"results": []}
+
+        result = pull_service.pull_space(space_key="SPACE")
+
+        assert result.pages_downloaded == 31
+        assert result.errors == []
+        assert len(list(tmp_path.rglob("page.xml"))) == 31
+
     def test_pull_space_no_homepage(
         self, pull_service: PullService, mock_client: MagicMock
     ) -> None:
@@ -476,8 +530,7 @@ class TestPagination:
         mock_client.get_page_by_id.return_value = page_data
         mock_client.get_attachments_from_content.return_value = attachment_data
 
-        mock_response = MagicMock()
-        mock_response.content = b"file content"
+        mock_response = SimpleNamespace(content=b"file content", raise_for_status=lambda: None)
         mock_client._session.get.return_value = mock_response
 
         result = pull_service.pull_page(page_id=12345)
@@ -532,8 +585,7 @@ class TestPagination:
             second_attachment_response,
         ]
 
-        mock_response = MagicMock()
-        mock_response.content = b"file content"
+        mock_response = SimpleNamespace(content=b"file content", raise_for_status=lambda: None)
         mock_client._session.get.return_value = mock_response
 
         result = pull_service.pull_page(page_id=12345)
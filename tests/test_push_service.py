@@ -1,6 +1,8 @@
 """Tests for PushService."""
 
+import io
 import json
+import sys
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
@@ -8,7 +10,14 @@ from unittest.mock import MagicMock
 import pytest
 from pytest_mock import MockerFixture
 
-from roundtripper.push_service import PushService, compute_content_hash
+from roundtripper.file_utils import (
+    compute_content_hash,
+    compute_file_hash,
+    compute_page_hash,
+    format_xml,
+)
+from roundtripper.pull_service import DEFAULT_MAX_WORKERS
+from roundtripper.push_service import PushService
 
 
 @pytest.fixture
@@ -110,6 +119,13 @@ class TestPushServiceInit:
         service = PushService(client=mock_client, message="Test", interactive=False)
         assert service.interactive is False
 
+    def test_max_workers(self, mock_client: MagicMock) -> None:
+        """Test configuring the number of concurrent page analyses."""
+        service = PushService(client=mock_client, message="Test", interactive=False)
+        assert service.max_workers == DEFAULT_MAX_WORKERS
+        service = PushService(client=mock_client, message="Test", interactive=False, max_workers=2)
+        assert service.max_workers == 2
+
 
 class TestPushPage:
     """Tests for pushing a single page."""
@@ -132,6 +148,77 @@ class TestPushPage:
         assert result.pages_updated == 0
         mock_client.update_page.assert_not_called()
 
+    def test_push_page_unchanged_since_pull(
+        self, push_service: PushService, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that pages matching the hash stored at pull time skip the server check."""
+        page_dir = create_page_directory(tmp_path, "Test Page")
+        json_file = page_dir / "page.json"
+        metadata = json.loads(json_file.read_text(encoding="utf-8"))
+        metadata["local_content_hash"] = compute_page_hash("<p>Content</p>")
+        json_file.write_text(json.dumps(metadata), encoding="utf-8")
+
+        result = push_service.push_page(page_dir)
+
+        assert result.pages_skipped == 1
+        assert result.pages_updated == 0
+        mock_client.get_page_by_id.assert_not_called()
+        mock_client.update_page.assert_not_called()
+
+    @pytest.mark.parametrize("content", ["<p>Content</p>\n", "\n  <p>Content</p>\n\n"])
+    def test_push_page_whitespace_only_edit(
+        self, push_service: PushService, mock_client: MagicMock, tmp_path: Path, content: str
+    ) -> None:
+        """Test that whitespace added at either end of page.xml does not push a new version."""
+        page_dir = create_page_directory(tmp_path, "Test Page")
+        json_file = page_dir / "page.json"
+        metadata = json.loads(json_file.read_text(encoding="utf-8"))
+        metadata["local_content_hash"] = compute_page_hash("<p>Content</p>")
+        json_file.write_text(json.dumps(metadata), encoding="utf-8")
+        (page_dir / "page.xml").write_text(content, encoding="utf-8")
+
+        result = push_service.push_page(page_dir)
+
+        assert result.pages_skipped == 1
+        assert result.pages_updated == 0
+        mock_client.update_page.assert_not_called()
+
+    @pytest.mark.parametrize("dry_run", [False, True])
+    def test_push_page_formats_server_content_only_for_diff(
+        self, mock_client: MagicMock, mocker: MockerFixture, tmp_path: Path, dry_run: bool
+    ) -> None:
+        """Test that server content unchanged since pull is only formatted to show a diff."""
+        service = PushService(
+            client=mock_client, message="Test", dry_run=dry_run, interactive=False
+        )
+        page_dir = create_page_directory(tmp_path, "Test Page", content="<p>Original</p>")
+        json_file = page_dir / "page.json"
+        metadata = json.loads(json_file.read_text(encoding="utf-8"))
+        metadata["local_content_hash"] = compute_page_hash("<p>Original</p>")
+        json_file.write_text(json.dumps(metadata), encoding="utf-8")
+        (page_dir / "page.xml").write_text("<p>Modified</p>", encoding="utf-8")
+        mock_client.get_page_by_id.return_value = {
+            "version": {"number": 1},
+            "body": {"storage": {"value": "<p>Original</p>"}},
+        }
+        mock_format_xml = mocker.patch(
+            "roundtripper.push_service.format_xml", return_value="<p>Original</p>"
+        )
+        mock_show_diff = mocker.patch.object(service, "_show_diff")
+        service._refresh_local_page = MagicMock()  # type: ignore[method-assign]
+
+        result = service.push_page(page_dir)
+
+        assert result.errors == []
+        if dry_run:
+            mock_format_xml.assert_called_once_with("<p>Original</p>")
+            mock_show_diff.assert_called_once_with(
+                "Test Page", "<p>Original</p>", "<p>Modified</p>"
+            )
+        else:
+            mock_format_xml.assert_not_called()
+            assert result.pages_updated == 1
+
     def test_push_page_changed(
         self, push_service: PushService, mock_client: MagicMock, tmp_path: Path
     ) -> None:
@@ -156,6 +243,8 @@ class TestPushPage:
 
         assert result.pages_updated == 1
         assert result.pages_skipped == 0
+        # Content and version are fetched with a single request
+        mock_client.get_page_by_id.assert_called_once_with(12345, expand="body.storage,version")
         mock_client.update_page.assert_called_once()
         push_service._refresh_local_page.assert_called_once()  # type: ignore[attr-defined]
 
@@ -196,13 +285,11 @@ class TestPushPage:
         xml_file.write_text("<p>Modified content</p>", encoding="utf-8")
 
         # Mock server returning different content and newer version
-        # First call is for content check, second for version check
         mock_client.get_page_by_id.side_effect = [
             {
                 "version": {"number": 3},
                 "body": {"storage": {"value": "<p>Original</p>"}},
             },
-            {"version": {"number": 3}},
         ]
 
         result = push_service.push_page(page_dir)
@@ -226,13 +313,11 @@ class TestPushPage:
         xml_file.write_text("<p>Modified content</p>", encoding="utf-8")
 
         # Mock server returning different content and newer version
-        # First call for content check, second for version check
         mock_client.get_page_by_id.side_effect = [
             {
                 "version": {"number": 3},
                 "body": {"storage": {"value": "<p>Original</p>"}},
             },
-            {"version": {"number": 3}},
         ]
 
         # Mock the refresh method to prevent actual pull
@@ -255,10 +340,10 @@ class TestPushPage:
         assert result.pages_skipped == 0
         assert result.pages_updated == 0
 
-    def test_push_page_version_check_exception(
+    def test_push_page_server_fetch_exception(
         self, push_service: PushService, mock_client: MagicMock, tmp_path: Path
     ) -> None:
-        """Test that version check exceptions don't block the push."""
+        """Test that a failed server fetch falls back to stored content and doesn't block."""
         page_dir = create_page_directory(
             tmp_path, "Test Page", content="<p>Original</p>", version=1
         )
@@ -267,14 +352,7 @@ class TestPushPage:
         xml_file = page_dir / "page.xml"
         xml_file.write_text("<p>Modified content</p>", encoding="utf-8")
 
-        # First call for content check returns data, second for version check fails
-        mock_client.get_page_by_id.side_effect = [
-            {
-                "version": {"number": 1},
-                "body": {"storage": {"value": "<p>Original</p>"}},
-            },
-            Exception("Network error"),
-        ]
+        mock_client.get_page_by_id.side_effect = Exception("Network error")
         mock_client.update_page.return_value = {}
 
         # Mock the refresh method to prevent actual pull
@@ -282,8 +360,9 @@ class TestPushPage:
 
         result = push_service.push_page(page_dir)
 
-        # Version check exception is caught and logged, update proceeds
+        # Fetch exception is caught and logged, no version known so update proceeds
         assert result.errors == []
+        assert result.conflicts == []
         assert result.pages_updated == 1
         mock_client.update_page.assert_called_once()
         push_service._refresh_local_page.assert_called_once()  # type: ignore[attr-defined]
@@ -306,20 +385,16 @@ class TestPushPage:
         child_confluence = child_dir / "page.xml"
         child_confluence.write_text("<p>Child Modified</p>", encoding="utf-8")
 
-        # Mock content checks and version checks
-        # Calls: parent content check, parent skip; child content check,
-        # child version check, child update
-        mock_client.get_page_by_id.side_effect = [
-            {
-                "version": {"number": 1},
-                "body": {"storage": {"value": "<p>Parent</p>"}},
-            },  # Parent unchanged
-            {
+        # Pages are analyzed concurrently, so answer by page ID: parent unchanged, child changed
+        server_bodies = {1: "<p>Parent</p>", 2: "<p>Child Original</p>"}
+
+        def get_page_by_id_side_effect(page_id: int, **kwargs: Any) -> dict[str, Any]:
+            return {
                 "version": {"number": 1},
-                "body": {"storage": {"value": "<p>Child Original</p>"}},
-            },  # Child changed
-            {"version": {"number": 1}},  # Child version check
-        ]
+                "body": {"storage": {"value": server_bodies[page_id]}},
+            }
+
+        mock_client.get_page_by_id.side_effect = get_page_by_id_side_effect
 
         # Mock the refresh method to prevent actual pull
         push_service._refresh_local_page = MagicMock()  # type: ignore[method-assign]
@@ -404,7 +479,6 @@ class TestPushAttachments:
                 "version": {"number": 1},
                 "body": {"storage": {"value": "<p>Original</p>"}},
             },  # Content changed
-            {"version": {"number": 1}},  # Version check
         ]
 
         # Mock the refresh method to prevent actual pull
@@ -444,7 +518,6 @@ class TestPushAttachments:
                 "version": {"number": 1},
                 "body": {"storage": {"value": "<p>Original</p>"}},
             },  # Content changed
-            {"version": {"number": 1}},  # Version check
         ]
 
         # Mock the refresh method to prevent actual pull
@@ -457,6 +530,41 @@ class TestPushAttachments:
         mock_client.attach_file.assert_not_called()
         push_service._refresh_local_page.assert_called_once()  # type: ignore[attr-defined]
 
+    @pytest.mark.parametrize(
+        ("stored_content", "expected_uploads"),
+        [(b"PDF content", 0), (b"PDF CONTENT", 1)],
+    )
+    def test_same_size_attachment_compares_hash(
+        self,
+        push_service: PushService,
+        mock_client: MagicMock,
+        tmp_path: Path,
+        stored_content: bytes,
+        expected_uploads: int,
+    ) -> None:
+        """Test that same-size attachments are uploaded only if their hash differs."""
+        page_dir = create_page_directory(tmp_path, "Test Page")
+        attachments_dir = page_dir / "attachments"
+        attachments_dir.mkdir()
+        (attachments_dir / "test.pdf").write_bytes(b"PDF content")
+        metadata: dict[str, Any] = {
+            "extensions": {"fileSize": len(stored_content)},
+            "local_content_hash": compute_content_hash(stored_content),
+        }
+        (attachments_dir / "test.pdf.json").write_text(json.dumps(metadata), encoding="utf-8")
+        (page_dir / "page.xml").write_text("<p>Modified</p>", encoding="utf-8")
+        mock_client.get_page_by_id.return_value = {
+            "version": {"number": 1},
+            "body": {"storage": {"value": "<p>Original</p>"}},
+        }
+        push_service._refresh_local_page = MagicMock()  # type: ignore[method-assign]
+
+        result = push_service.push_page(page_dir)
+
+        assert result.attachments_uploaded == expected_uploads
+        assert result.attachments_skipped == 1 - expected_uploads
+        assert mock_client.attach_file.call_count == expected_uploads
+
     def test_push_modified_attachment(
         self, push_service: PushService, mock_client: MagicMock, tmp_path: Path
     ) -> None:
@@ -484,7 +592,6 @@ class TestPushAttachments:
                 "version": {"number": 1},
                 "body": {"storage": {"value": "<p>Original</p>"}},
             },  # Content changed
-            {"version": {"number": 1}},  # Version check
         ]
 
         # Mock the refresh method to prevent actual pull
@@ -495,6 +602,90 @@ class TestPushAttachments:
         assert result.attachments_uploaded == 1
         mock_client.attach_file.assert_called_once()
         push_service._refresh_local_page.assert_called_once()  # type: ignore[attr-defined]
+        # The metadata now describes the uploaded file
+        metadata = json.loads(metadata_file.read_text(encoding="utf-8"))
+        assert metadata["extensions"]["fileSize"] == attachment_file.stat().st_size
+        assert metadata["local_content_hash"] == compute_file_hash(attachment_file)
+
+    def test_push_attachments_with_failed_upload(
+        self, push_service: PushService, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that a failed upload is recorded while the other uploads are still counted."""
+        page_dir = create_page_directory(tmp_path, "Test Page")
+        attachments_dir = page_dir / "attachments"
+        attachments_dir.mkdir()
+        for name in ("a.pdf", "b.pdf", "c.pdf"):
+            (attachments_dir / name).write_bytes(b"content")
+        (page_dir / "page.xml").write_text("<p>Modified</p>", encoding="utf-8")
+        mock_client.get_page_by_id.return_value = {
+            "version": {"number": 1},
+            "body": {"storage": {"value": "<p>Original</p>"}},
+        }
+
+        def attach_file(filename: str, page_id: str, name: str) -> None:
+            if name == "a.pdf":
+                raise RuntimeError("upload failed")
+
+        mock_client.attach_file.side_effect = attach_file
+        push_service._refresh_local_page = MagicMock()  # type: ignore[method-assign]
+
+        result = push_service.push_page(page_dir)
+
+        assert result.pages_updated == 1
+        assert result.attachments_uploaded == 2
+        assert mock_client.attach_file.call_count == 3
+        assert len(result.errors) == 1
+        assert "a.pdf: upload failed" in result.errors[0]
+        assert not (attachments_dir / "a.pdf.json").exists()
+        assert (attachments_dir / "b.pdf.json").exists()
+        assert (attachments_dir / "c.pdf.json").exists()
+
+    def test_push_many_attachments_concurrently(
+        self, push_service: PushService, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that all new attachments of a page are uploaded and counted."""
+        page_dir = create_page_directory(tmp_path, "Test Page")
+        attachments_dir = page_dir / "attachments"
+        attachments_dir.mkdir()
+        names = [f"file{i}.pdf" for i in range(12)]
+        for name in names:
+            (attachments_dir / name).write_bytes(name.encode())
+        (page_dir / "page.xml").write_text("<p>Modified</p>", encoding="utf-8")
+        mock_client.get_page_by_id.return_value = {
+            "version": {"number": 1},
+            "body": {"storage": {"value": "<p>Original</p>"}},
+        }
+        push_service._refresh_local_page = MagicMock()  # type: ignore[method-assign]
+
+        result = push_service.push_page(page_dir)
+
+        assert result.attachments_uploaded == len(names)
+        assert result.errors == []
+        uploaded = {call.kwargs["name"] for call in mock_client.attach_file.call_args_list}
+        assert uploaded == set(names)
+
+    def test_attachment_upload_error_is_recorded(
+        self, push_service: PushService, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that a failing upload is recorded as an error for the page."""
+        page_dir = create_page_directory(tmp_path, "Test Page")
+        attachments_dir = page_dir / "attachments"
+        attachments_dir.mkdir()
+        (attachments_dir / "test.pdf").write_bytes(b"PDF content")
+        (page_dir / "page.xml").write_text("<p>Modified</p>", encoding="utf-8")
+        mock_client.get_page_by_id.return_value = {
+            "version": {"number": 1},
+            "body": {"storage": {"value": "<p>Original</p>"}},
+        }
+        mock_client.attach_file.side_effect = Exception("Upload failed")
+        push_service._refresh_local_page = MagicMock()  # type: ignore[method-assign]
+
+        result = push_service.push_page(page_dir)
+
+        assert result.attachments_uploaded == 0
+        assert len(result.errors) == 1
+        assert "Upload failed" in result.errors[0]
+        assert not (attachments_dir / "test.pdf.json").exists()
 
 
 class TestErrorHandling:
@@ -510,13 +701,12 @@ class TestErrorHandling:
         xml_file = page_dir / "page.xml"
         xml_file.write_text("<p>Modified</p>", encoding="utf-8")
 
-        # Mock content check success, version check success, but update failure
+        # Mock content and version check success, but update failure
         mock_client.get_page_by_id.side_effect = [
             {
                 "version": {"number": 1},
                 "body": {"storage": {"value": "<p>Original</p>"}},
             },  # Content changed
-            {"version": {"number": 1}},  # Version check
         ]
         mock_client.update_page.side_effect = Exception("API Error")
 
@@ -525,6 +715,20 @@ class TestErrorHandling:
         assert len(result.errors) == 1
         assert "API Error" in result.errors[0]
 
+    def test_invalid_metadata_is_recorded_as_error(
+        self, push_service: PushService, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that a page failing analysis is recorded as an error."""
+        page_dir = create_page_directory(tmp_path, "Test Page")
+        (page_dir / "page.json").write_text("{not json", encoding="utf-8")
+
+        result = push_service.push_page(page_dir)
+
+        assert len(result.errors) == 1
+        assert "Failed to push" in result.errors[0]
+        mock_client.get_page_by_id.assert_not_called()
+        mock_client.update_page.assert_not_called()
+
 
 class TestFindPages:
     """Tests for finding pages in directory structure."""
@@ -559,6 +763,58 @@ class TestFindPages:
         assert page2_dir in all_pages
         assert nested_dir in all_pages
 
+    def test_find_pages_skips_attachments_and_orders_parents_first(
+        self, push_service: PushService, tmp_path: Path
+    ) -> None:
+        """Test that attachments are not searched and pages come depth-first by name."""
+        space_dir = tmp_path / "SPACE"
+        folder_dir = space_dir / "Folder"
+        folder_dir.mkdir(parents=True)
+        zeta_dir = create_page_directory(folder_dir, "Zeta")
+        parent_dir = create_page_directory(folder_dir, "Parent")
+        child_b_dir = create_page_directory(parent_dir, "Child B")
+        child_a_dir = create_page_directory(parent_dir, "Child A")
+        grandchild_dir = create_page_directory(child_a_dir, "Grandchild")
+        create_page_directory(parent_dir / "attachments", "Hidden")
+
+        all_pages = push_service._find_all_pages(space_dir)
+        children = push_service._find_child_pages(parent_dir)
+
+        assert all_pages == [parent_dir, child_a_dir, grandchild_dir, child_b_dir, zeta_dir]
+        assert children == [child_a_dir, grandchild_dir, child_b_dir]
+
+    def test_find_child_pages_skips_non_page_folders(
+        self, push_service: PushService, tmp_path: Path
+    ) -> None:
+        """Test that child pages are only searched below page directories."""
+        parent_dir = create_page_directory(tmp_path, "Parent")
+        child_dir = create_page_directory(parent_dir, "Child")
+        backup_dir = parent_dir / "backup"
+        backup_dir.mkdir()
+        backup_page_dir = create_page_directory(backup_dir, "Child")
+
+        children = push_service._find_child_pages(parent_dir)
+        all_pages = push_service._find_all_pages(tmp_path)
+
+        assert children == [child_dir]
+        assert backup_page_dir in all_pages
+
+    def test_find_pages_skips_symlinked_folders(
+        self, push_service: PushService, tmp_path: Path
+    ) -> None:
+        """Test that symlinked directories are not followed."""
+        space_dir = tmp_path / "SPACE"
+        space_dir.mkdir()
+        page_dir = create_page_directory(space_dir, "Page")
+        (page_dir / "loop").symlink_to(space_dir, target_is_directory=True)
+        (space_dir / "linked").symlink_to(page_dir, target_is_directory=True)
+
+        all_pages = push_service._find_all_pages(space_dir)
+        children = push_service._find_child_pages(page_dir)
+
+        assert all_pages == [page_dir]
+        assert children == []
+
 
 class TestHelperFunctions:
     """Tests for helper functions."""
@@ -574,6 +830,68 @@ class TestHelperFunctions:
         assert hash1 != hash3
         assert len(hash1) == 64  # SHA256 hex digest length
 
+    def test_show_diff_colors_each_line(
+        self,
+        push_service: PushService,
+        capsys: pytest.CaptureFixture[str],
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that the diff is colored per line on a terminal and every line is terminated."""
+        mocker.patch.object(sys.stdout, "isatty", return_value=True)
+
+        push_service._show_diff("Page", "<a/>\n<b/>\n<c/>", "<a/>\n<B/>\n<c/>")
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == [
+            "\033[1m--- server/Page\033[0m",
+            "\033[1m+++ local/Page\033[0m",
+            "\033[36m@@ -1,3 +1,3 @@\033[0m",
+            " <a/>",
+            "\033[31m-<b/>\033[0m",
+            "\033[32m+<B/>\033[0m",
+            " <c/>",
+            "",
+        ]
+
+    def test_show_diff_without_binary_buffer(
+        self, push_service: PushService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the colored diff is written as text if stdout has no binary buffer."""
+
+        class TextConsole(io.StringIO):
+            def isatty(self) -> bool:
+                return True
+
+        console = TextConsole()
+        monkeypatch.setattr(sys, "stdout", console)
+
+        push_service._show_diff("Page", "<a/>", "<A/>")
+
+        assert console.getvalue().splitlines() == [
+            "\033[1m--- server/Page\033[0m",
+            "\033[1m+++ local/Page\033[0m",
+            "\033[36m@@ -1 +1 @@\033[0m",
+            "\033[31m-<a/>\033[0m",
+            "\033[32m+<A/>\033[0m",
+            "",
+        ]
+
+    def test_show_diff_plain_when_redirected(
+        self, push_service: PushService, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that the diff has no ANSI escapes when stdout is not a terminal."""
+        push_service._show_diff("Page", "<a/>\n<b/>", "<a/>\n<B/>")
+
+        assert capsys.readouterr().out.splitlines() == [
+            "--- server/Page",
+            "+++ local/Page",
+            "@@ -1,2 +1,2 @@",
+            " <a/>",
+            "-<b/>",
+            "+<B/>",
+            "",
+        ]
+
 
 class TestDryRunBehavior:
     """Tests specifically for dry-run behavior."""
@@ -618,10 +936,9 @@ class TestDryRunBehavior:
         xml_file = page_dir / "page.xml"
         xml_file.write_text("<p>Modified</p>", encoding="utf-8")
 
-        # Server has newer version - first call for content check, second for version check
+        # Server has newer version
         mock_client.get_page_by_id.side_effect = [
             {"version": {"number": 5}, "body": {"storage": {"value": "<p>Original</p>"}}},
-            {"version": {"number": 5}},
         ]
 
         result = service.push_page(page_dir)
@@ -766,3 +1083,69 @@ class TestRefreshLocalPage:
         mock_pull_service_class.assert_called_once_with(mock_client, page_dir.parent, dry_run=False)
         # Verify _pull_page was called with correct page_id
         mock_pull_page.assert_called_once_with(12345)
+
+    def test_update_response_replaces_refresh(
+        self, push_service: PushService, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that the page files are rewritten from the update response without pulling."""
+        page_dir = create_page_directory(tmp_path, "Test Page", content="<p>Original</p>")
+        (page_dir / "page.xml").write_text("<p>Modified</p>", encoding="utf-8")
+        mock_client.get_page_by_id.return_value = {
+            "version": {"number": 1},
+            "body": {"storage": {"value": "<p>Original</p>"}},
+        }
+        # Confluence normalizes the stored body, e.g., by adding IDs to elements
+        stored_body = '<p ac:local-id="abc">Modified</p>'
+        mock_client.update_page.return_value = {
+            "id": "12345",
+            "version": {"number": 2},
+            "body": {"storage": {"value": stored_body, "representation": "storage"}},
+        }
+        push_service._refresh_local_page = MagicMock()  # type: ignore[method-assign]
+
+        result = push_service.push_page(page_dir)
+
+        assert result.pages_updated == 1
+        push_service._refresh_local_page.assert_not_called()  # type: ignore[attr-defined]
+        page_xml = (page_dir / "page.xml").read_text(encoding="utf-8")
+        assert page_xml == format_xml(stored_body)
+        metadata = json.loads((page_dir / "page.json").read_text(encoding="utf-8"))
+        assert metadata["version"]["number"] == 2
+        assert metadata["title"] == "Test Page"
+        assert metadata["local_content_hash"] == compute_page_hash(page_xml)
+        assert metadata["body"]["storage"]["value"] == stored_body
+
+        # A second push finds the page unchanged without asking the server
+        mock_client.get_page_by_id.reset_mock()
+        second = PushService(client=mock_client, message="Test", interactive=False)
+        assert second.push_page(page_dir).pages_skipped == 1
+        mock_client.get_page_by_id.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "response",
+        [None, {"version": {"number": 2}}, {"body": {"storage": {"value": "<p>Modified</p>"}}}],
+        ids=["no-dict", "no-body", "no-version"],
+    )
+    def test_incomplete_update_response_refreshes(
+        self,
+        response: object,
+        push_service: PushService,
+        mock_client: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test that the page is pulled again if the update response lacks version or body."""
+        page_dir = create_page_directory(tmp_path, "Test Page", content="<p>Original</p>")
+        (page_dir / "page.xml").write_text("<p>Modified</p>", encoding="utf-8")
+        mock_client.get_page_by_id.return_value = {
+            "version": {"number": 1},
+            "body": {"storage": {"value": "<p>Original</p>"}},
+        }
+        mock_client.update_page.return_value = response
+        push_service._refresh_local_page = MagicMock()  # type: ignore[method-assign]
+
+        result = push_service.push_page(page_dir)
+
+        assert result.pages_updated == 1
+        push_service._refresh_local_page.assert_called_once_with(  # type: ignore[attr-defined]
+            12345, page_dir
+        )